@@ -13,27 +13,36 @@ except ImportError:  # Security: handle missing optional dependency safely
         pass
 
 
-from kivy.config import Config
-from ui import ModernScraperApp
 from utils import configure_logging  # Ensure this import is present
 
-# Load environment variables from .env file
-load_dotenv()
-configure_logging()
 
-if not DOTENV_AVAILABLE:
-    logging.warning(
-        "python-dotenv not installed; .env file will be ignored"
-    )  # Security: warn about missing configuration without aborting
+def configure_kivy() -> None:
+    """Apply Kivy settings from environment variables.
 
-# Configure Kivy settings from environment variables
-Config.set("graphics", "multisamples", "0")  # Disable multisampling
-Config.set("graphics", "fullscreen", os.getenv("KIVY_FULLSCREEN", "auto"))
-Config.set("graphics", "width", os.getenv("KIVY_WIDTH", "800"))
-Config.set("graphics", "height", os.getenv("KIVY_HEIGHT", "600"))
+    Must run before any Kivy window is created, i.e. before ``ui`` is imported.
+    """
+    from kivy.config import Config
+
+    Config.set("graphics", "multisamples", "0")  # Disable multisampling
+    Config.set("graphics", "fullscreen", os.getenv("KIVY_FULLSCREEN", "auto"))
+    Config.set("graphics", "width", os.getenv("KIVY_WIDTH", "800"))
+    Config.set("graphics", "height", os.getenv("KIVY_HEIGHT", "600"))
 
 
 def main():
+    # Load environment variables from .env file
+    load_dotenv()
+    configure_logging()
+
+    if not DOTENV_AVAILABLE:
+        logging.warning(
+            "python-dotenv not installed; .env file will be ignored"
+        )  # Security: warn about missing configuration without aborting
+
+    # Kivy and the UI are imported lazily so importing this module stays cheap
+    configure_kivy()
+    from ui import ModernScraperApp
+
     try:
         ModernScraperApp().run()
     except Exception as e:
@@ -1,35 +1,100 @@
-from time import time
-from typing import Any, Dict, Optional
+import threading
+from collections import deque
+from time import perf_counter, strftime
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-from kivy.clock import mainthread
+from kivy.clock import Clock, mainthread
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.progressbar import ProgressBar
+from kivy.uix.textinput import TextInput
 
 from utils import sanitize_url
 
+# Minimum seconds between redraws of the overall statistics (~10 Hz)
+DISPLAY_REFRESH_INTERVAL = 0.1
+# Completions averaged over for the displayed speed
+SPEED_WINDOW = 50
+# Finished rows kept on screen; older ones are detached so long runs do not
+# grow the layout without bound
+FINISHED_ROWS_KEPT = 500
+# Lines kept in the log view; each flush re-renders at most this many
+LOG_LINES_KEPT = 500
+
+
+class _UrlEntry:
+    """Widgets and timing state for one tracked URL."""
+
+    __slots__ = ("layout", "status", "progress", "start_time", "finished")
+
+    def __init__(
+        self, layout: BoxLayout, status: Label, progress: Label, start_time: float
+    ) -> None:
+        self.layout = layout
+        self.status = status
+        self.progress = progress
+        self.start_time = start_time
+        self.finished = False
+
 
 class ScrapingProgressTracker(BoxLayout):
     """Thread-safe progress tracker for URL scraping."""
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(orientation="vertical", **kwargs)
-        self.url_widgets: Dict[str, Dict[str, Any]] = {}
+        self.url_widgets: Dict[str, _UrlEntry] = {}
         self.total_urls = 0
         self.completed_urls = 0
-        self.start_time = time()
+        # perf_counter is monotonic, so ETA math is immune to wall-clock jumps
+        self.start_time = perf_counter()
+        # Times of the last SPEED_WINDOW completions, preceded by the one
+        # before them (initially the start time) as the window's left edge
+        self._completion_times: Deque[float] = deque(
+            [self.start_time], maxlen=SPEED_WINDOW + 1
+        )
+        self._display_update_pending = False
+        self._finished_rows: Deque[_UrlEntry] = deque()
+        # Status updates and log lines queued by worker threads, applied in
+        # one Clock tick
+        self._pending_updates: List[Tuple[str, str, str, Optional[int]]] = []
+        self._pending_log: List[str] = []
+        self._log_lines: Deque[str] = deque(maxlen=LOG_LINES_KEPT)
+        # Keep the newest log line in view; set from the app's settings
+        self.auto_scroll = True
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
         # Overall stats widgets
         self.progress_bar = ProgressBar(max=100)
         self.stats_label = Label(text="Progress: 0% | Speed: 0 URL/min | ETA: --")
+        self.log_output = TextInput(readonly=True, size_hint_y=0.4)
         self.add_widget(self.progress_bar)
         self.add_widget(self.stats_label)
+        self.add_widget(self.log_output)
 
     @mainthread
     def add_url(self, url: str) -> None:
         """Register a new URL for tracking."""
+        if self._register_url(url):
+            self._schedule_overall_display()
+
+    @mainthread
+    def add_urls(self, urls: List[str]) -> None:
+        """Register many URLs in a single main-thread callback.
+
+        Prefer this over calling ``add_url`` in a loop: it costs one Clock hop
+        and one stats redraw for the whole batch.
+        """
+        added = False
+        for url in urls:
+            added = self._register_url(url) or added
+        if added:
+            self._schedule_overall_display()
+
+    def _register_url(self, url: str) -> bool:
+        """Create the row widgets for ``url``; return False if already tracked."""
         sanitized = sanitize_url(url)  # Security: remove control chars from URL
         if sanitized in self.url_widgets:
-            return
+            return False
         layout = BoxLayout(orientation="horizontal")
         status_label = Label(text="Queued")
         progress_label = Label(text="0%")
@@ -37,45 +102,116 @@ class ScrapingProgressTracker(BoxLayout):
         layout.add_widget(status_label)
         layout.add_widget(progress_label)
         self.add_widget(layout)
-        self.url_widgets[sanitized] = {
-            "layout": layout,
-            "status": status_label,
-            "progress": progress_label,
-            "start_time": time(),
-            "finished": False,
-        }
+        self.url_widgets[sanitized] = _UrlEntry(
+            layout, status_label, progress_label, perf_counter()
+        )
         self.total_urls += 1
-        self._update_overall_display()
+        return True
 
-    @mainthread
     def update_url_progress(
         self, url: str, status: str, message: str = "", data_size: Optional[int] = None
+    ) -> None:
+        """Queue a UI update for a specific URL; safe to call from any thread.
+
+        Updates are coalesced so a burst of calls costs one Clock callback.
+        """
+        self._queue(self._pending_updates, (url, status, message, data_size))
+
+    def log_message(self, message: str) -> None:
+        """Append a line to the log view; safe to call from any thread.
+
+        Lines queued within a frame are written with a single text update.
+        """
+        self._queue(self._pending_log, sanitize_url(message))
+
+    def _queue(self, pending: List[Any], item: Any) -> None:
+        with self._pending_lock:
+            pending.append(item)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        Clock.schedule_once(self._flush_pending_updates, 0)
+
+    def _flush_pending_updates(self, _dt: float) -> None:
+        with self._pending_lock:
+            updates, self._pending_updates = self._pending_updates, []
+            lines, self._pending_log = self._pending_log, []
+            self._flush_scheduled = False
+        for update in updates:
+            self._apply_url_progress(*update)
+        if lines:
+            # Rendering the bounded tail keeps each update O(LOG_LINES_KEPT)
+            # however long the run gets
+            # Lines in one flush arrived within a frame: format the clock once
+            stamp = strftime("%H:%M:%S")
+            self._log_lines.extend(f"[{stamp}] {line}" for line in lines)
+            self.log_output.text = "\n".join(self._log_lines)
+            if self.auto_scroll:
+                self.log_output.cursor = (0, len(self._log_lines) - 1)
+
+    def _apply_url_progress(
+        self, url: str, status: str, message: str, data_size: Optional[int]
     ) -> None:
         """Update UI for a specific URL."""
         sanitized = sanitize_url(url)
         if sanitized not in self.url_widgets:
             return  # Unknown URL; ignore silently
-        widgets = self.url_widgets[sanitized]
-        widgets["status"].text = status
+        entry = self.url_widgets[sanitized]
+        entry.status.text = status
         if data_size is not None:
-            widgets["progress"].text = f"{data_size}B"
-        if status in {"completed", "failed"} and not widgets["finished"]:
-            widgets["finished"] = True
+            entry.progress.text = f"{data_size}B"
+        if status in {"completed", "failed"} and not entry.finished:
+            entry.finished = True
             self.completed_urls += 1
+            self._record_completion()
+            self._retire_row(entry)
         if message:
-            widgets["progress"].text = sanitize_url(message)
+            entry.progress.text = sanitize_url(message)
+        self._schedule_overall_display()
+
+    def _retire_row(self, entry: _UrlEntry) -> None:
+        """Queue a finished row, detaching the oldest beyond ``FINISHED_ROWS_KEPT``."""
+        self._finished_rows.append(entry)
+        if len(self._finished_rows) > FINISHED_ROWS_KEPT:
+            # The entry stays in url_widgets so counts and dedupe are unaffected
+            self.remove_widget(self._finished_rows.popleft().layout)
+
+    def _record_completion(self) -> None:
+        """Add the latest completion to the speed window."""
+        self._completion_times.append(perf_counter())
+
+    @property
+    def speed(self) -> float:
+        """Completion rate in URLs per minute over the recent window.
+
+        Completions are counted over the time they span, so a batch that lands
+        in one flush (near-zero gaps) cannot inflate the rate.
+        """
+        times = self._completion_times
+        span = times[-1] - times[0]
+        if span <= 0.0:
+            return 0.0
+        return 60.0 * (len(times) - 1) / span
+
+    def _schedule_overall_display(self) -> None:
+        """Coalesce overall-stat redraws into one per refresh interval."""
+        if self._display_update_pending:
+            return
+        self._display_update_pending = True
+        Clock.schedule_once(self._flush_overall_display, DISPLAY_REFRESH_INTERVAL)
+
+    def _flush_overall_display(self, _dt: float) -> None:
+        self._display_update_pending = False
         self._update_overall_display()
 
-    @mainthread
     def _update_overall_display(self) -> None:
         """Recompute and update global statistics."""
         if self.total_urls == 0:
             return
         completion_pct = int((self.completed_urls / self.total_urls) * 100)
-        elapsed = max(time() - self.start_time, 1)
-        speed = (self.completed_urls / elapsed) * 60  # URLs per minute
+        speed = self.speed  # URLs per minute
         remaining = self.total_urls - self.completed_urls
-        eta = (remaining / speed) if speed else float("inf")
+        eta = (remaining / speed) * 60 if speed else float("inf")
         self.progress_bar.value = completion_pct
         eta_text = f"{eta:.1f} sec" if speed else "--"
         self.stats_label.text = (
@@ -1,18 +1,52 @@
 import os
 import requests
 import random
+import re
 import logging
 import time
 import socket
 import ipaddress
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup, Tag
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict, deque
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry  # FIXED: Updated import path
 from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException
 import concurrent.futures
-from urllib.parse import urlparse
-from utils import configure_logging, log_json, sanitize_url
+from urllib.parse import quote, urlencode
+from utils import configure_logging, log_json, parse_url, sanitize_url
+
+# Optional dependency used only by the asyncio pipeline; slow to import, so it
+# is loaded on first use by _import_aiohttp
+aiohttp = None
+
+# libxml2-backed tree builder, much faster than html.parser; only probed here,
+# BeautifulSoup imports it when the fallback parser actually runs
+if importlib.util.find_spec("lxml") is not None:
+    HTML_PARSER = "lxml"
+else:  # Fall back to the pure-Python stdlib parser
+    HTML_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional fast path; BeautifulSoup is used without it
+    LexborHTMLParser = None
 
 # Configure logging
 configure_logging()
@@ -22,12 +56,13 @@ logger = logging.getLogger(__name__)
 # Load API key from environment variable - SECURITY IMPROVEMENT
 API_KEY = os.getenv("SCRAPER_API_KEY")
 if not API_KEY:
-    logging.debug("Environment variable 'SCRAPER_API_KEY' not set")
+    logger.debug("Environment variable 'SCRAPER_API_KEY' not set")
     _api_msg = "Required API key not found in environment"
-    logging.error(_api_msg)
+    logger.error(_api_msg)
     raise ValueError(_api_msg)
 
-SCRAPERAPI_URL = f"https://api.scraperapi.com?api_key={API_KEY}&url="
+# Prefix built once; only the target URL is encoded per request
+SCRAPERAPI_URL = f"https://api.scraperapi.com?{urlencode({'api_key': API_KEY})}&url="
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -43,13 +78,70 @@ BACKOFF_FACTOR = float(os.getenv("SCRAPER_BACKOFF_FACTOR", "1"))
 REQUEST_TIMEOUT = int(os.getenv("SCRAPER_TIMEOUT", "10"))
 PAGE_RETRIES = int(os.getenv("SCRAPER_PAGE_RETRIES", "3"))
 RETRY_DELAY = int(os.getenv("SCRAPER_RETRY_DELAY", "5"))
+ASYNC_CONCURRENCY = int(os.getenv("SCRAPER_ASYNC_CONCURRENCY", "50"))
+POOL_SIZE = int(os.getenv("SCRAPER_POOL_SIZE", "64"))
+# Response bodies are read in chunks and cut off past this many bytes
+MAX_CONTENT_BYTES = int(os.getenv("SCRAPER_MAX_CONTENT_BYTES", str(10 * 1024 * 1024)))
+STREAM_CHUNK_SIZE = 64 * 1024
+# Most pages scrape_urls_to_files holds in memory waiting to be written
+MAX_PENDING_WRITES = 16
+# Optional on-disk response cache; disabled unless a directory is configured
+CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR", "")
+CACHE_TTL = int(os.getenv("SCRAPER_CACHE_TTL", "86400"))
+# How long a hostname's DNS check is trusted before it is resolved again
+DNS_CACHE_TTL = float(os.getenv("SCRAPER_DNS_CACHE_TTL", "300"))
+# Minimum seconds between requests to the same target host (0 disables);
+# requests waiting on their host hold no worker or concurrency slot, so
+# requests to different hosts are never delayed
+HOST_MIN_INTERVAL = float(os.getenv("SCRAPER_HOST_INTERVAL", "0"))
+# Opt-in HTTP/2 through httpx, multiplexing requests over one connection
+USE_HTTP2 = os.getenv("SCRAPER_HTTP2", "").lower() in ("1", "true", "yes")
+# Resolve A records only on IPv4-only networks, halving resolver queries
+DNS_FAMILY = (
+    socket.AF_INET
+    if os.getenv("SCRAPER_DNS_IPV4_ONLY", "").lower() in ("1", "true", "yes")
+    else socket.AF_UNSPEC
+)
+
+# Headers that never vary between requests; only the User-Agent is rotated per call
+DEFAULT_HEADERS = {
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,*/*;q=0.8"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+    # Only advertises codecs urllib3 can decode (br/zstd when their packages exist)
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+    "Connection": "keep-alive",
+    "DNT": "1",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Elements whose text is extracted from the main content area
+CONTENT_SELECTOR = "h1, h2, h3, h4, h5, h6, p, div, span, li, code, pre, blockquote, q"
+SKIP_TAGS = frozenset(("script", "style", "nav", "header", "footer"))
+CODE_TAGS = frozenset(("code", "pre"))
+QUOTE_TAGS = frozenset(("blockquote", "q"))
+HEADER_MARKERS = {f"h{level}": "#" * level for level in range(1, 7)}
+# Characters replaced in output filenames, mapped in one C-level pass
+FILENAME_TRANSLATION = str.maketrans({c: "_" for c in './\\*?:"<>|'})
+UNDERSCORE_RUN = re.compile(r"_{2,}")
+# Main content containers, in priority order: tag, then class, then id
+MAIN_CONTENT_TAGS = frozenset(("article", "main"))
+MAIN_CONTENT_NAMES = frozenset(("content", "main-content"))
+MAIN_CONTENT_SELECTOR = "article, main, .content, .main-content, #content, #main-content"
+
+# Statuses retried with backoff, by the requests session and the HTTP/2 path
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504, 520, 521, 522, 523, 524))
+# Longest backoff between HTTP/2 retries, matching urllib3's Retry default
+RETRY_BACKOFF_MAX = 120.0
 
 # IMPROVED: Better retry configuration with more specific status codes and methods
 session = requests.Session()
 retries = Retry(
     total=RETRY_TOTAL,
     backoff_factor=BACKOFF_FACTOR,
-    status_forcelist=[429, 500, 502, 503, 504, 520, 521, 522, 523, 524],
+    status_forcelist=RETRY_STATUSES,
     allowed_methods=frozenset(
         [
             "GET",
@@ -62,95 +154,450 @@ retries = Retry(
         ]
     ),  # Updated from 'method_whitelist'
 )
-session.mount("http://", HTTPAdapter(max_retries=retries))
-session.mount("https://", HTTPAdapter(max_retries=retries))  # Added HTTPS adapter
+session.headers.update(DEFAULT_HEADERS)
 
 
-def get_random_user_agent():
-    """Select a random user agent from the list."""
-    return random.choice(USER_AGENTS)
+def configure_session(pool_size: int = POOL_SIZE) -> None:
+    """Mount one pooled adapter holding up to ``pool_size`` connections.
 
+    Concurrent scrapes reuse keep-alive connections to the ScraperAPI host
+    instead of re-handshaking TLS. Call this before scraping with more than
+    ``SCRAPER_POOL_SIZE`` workers; ``iter_scrape_results`` caps its workers
+    at the pool size.
+    """
+    global POOL_SIZE
+    POOL_SIZE = pool_size
+    # A single adapter serves both schemes; all production traffic is https
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
-def validate_url(url):
-    """Validate URL format, scheme, hostname, IP address, and port."""
+
+configure_session()
+
+
+# User agents are drawn in batches; see get_random_user_agent
+USER_AGENT_BATCH_SIZE = 1024
+_user_agent_batch = iter(())
+_user_agent_lock = threading.Lock()
+# One prebuilt header dict per user agent, shared by every request using it
+_USER_AGENT_HEADERS = {ua: {"User-Agent": ua} for ua in USER_AGENTS}
+
+
+def get_random_user_agent():
+    """Select a random user agent from the list.
+
+    Picks come from a pre-drawn ``random.choices`` batch, refilled when empty.
+    """
+    global _user_agent_batch
     try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ValueError(f"Invalid URL format: {url}")
-        if parsed.scheme not in ["http", "https"]:
-            raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
+        return next(_user_agent_batch)
+    except StopIteration:
+        with _user_agent_lock:
+            _user_agent_batch = iter(random.choices(USER_AGENTS, k=USER_AGENT_BATCH_SIZE))
+            return next(_user_agent_batch)
+
+
+def build_request_headers(
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Build the per-request headers, letting ``headers`` override them.
+
+    Static headers live in ``DEFAULT_HEADERS`` and are applied at the session
+    level, so only the rotated User-Agent is added here. Without overrides a
+    shared prebuilt dict is returned; callers must not mutate it.
+    """
+    user_agent = get_random_user_agent()
+    if not headers:
+        return _USER_AGENT_HEADERS[user_agent]
+    return {"User-Agent": user_agent, **headers}
+
+
+def build_api_url(url: str) -> str:
+    """Return the ScraperAPI request URL for ``url``.
+
+    The target is percent-encoded so ``&``, ``#`` and ``%`` in it cannot leak
+    into the API's own query string.
+    """
+    return SCRAPERAPI_URL + quote(url, safe="")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_target(url: str) -> str:
+    """Check URL format, scheme and port, returning the hostname.
+
+    Pure string checks, so results are memoized per URL. Raises ValueError.
+    """
+    parsed = parse_url(url)
+    if not parsed.scheme or not parsed.netloc:
+        raise ValueError(f"Invalid URL format: {url}")
+    if parsed.scheme not in ["http", "https"]:
+        raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
+
+    if parsed.port not in (None, 80, 443):
+        raise ValueError(f"Disallowed port: {parsed.port}")
+
+    hostname = parsed.hostname
+    if not hostname:
+        raise ValueError("Missing hostname")
+    return hostname
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_forbidden_ip(ip_str: str) -> bool:
+    """Return True for private or loopback addresses.
 
-        if parsed.port not in (None, 80, 443):
-            raise ValueError(f"Disallowed port: {parsed.port}")
+    Memoized per address string: ``ipaddress``'s checks walk lists of network
+    objects in Python, and hosts behind the same CDN share addresses.
+    """
+    ip_obj = ipaddress.ip_address(ip_str)
+    return ip_obj.is_private or ip_obj.is_loopback
+
+
+# Most hostnames whose DNS check is remembered; least recently used go first
+HOST_CHECK_CACHE_SIZE = 1024
+# hostname -> (expiry on the monotonic clock, error message or None if allowed),
+# in least-recently-used order. The lock is not held across the DNS lookup, so
+# at worst two threads resolve the same host once each.
+_host_checks: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+_host_checks_lock = threading.Lock()
 
-        hostname = parsed.hostname
-        if not hostname:
-            raise ValueError("Missing hostname")
 
+def _check_host(hostname: str) -> None:
+    """Resolve ``hostname`` and reject private or loopback addresses.
+
+    Outcomes are cached for ``DNS_CACHE_TTL`` seconds so a batch of URLs on
+    the same host pays for one ``getaddrinfo`` call. Lookup failures are not
+    cached. Raises ValueError.
+    """
+    now = time.monotonic()
+    with _host_checks_lock:
+        cached = _host_checks.get(hostname)
+        if cached is not None:
+            _host_checks.move_to_end(hostname)
+    if cached is None or cached[0] <= now:
         try:
-            infos = socket.getaddrinfo(hostname, None)
+            # SOCK_STREAM and a numeric service skip the duplicate per-socket-type
+            # entries and the services lookup; only the addresses matter here
+            infos = socket.getaddrinfo(
+                hostname, 0, DNS_FAMILY, socket.SOCK_STREAM, 0, socket.AI_NUMERICSERV
+            )
         except socket.gaierror as e:
             raise ValueError(f"DNS resolution failed for {hostname}") from e
 
+        error = None
         for info in infos:
             ip_str = info[4][0]
-            ip_obj = ipaddress.ip_address(ip_str)
-            if ip_obj.is_private or ip_obj.is_loopback:
-                raise ValueError(f"Forbidden IP address: {ip_str}")
+            if _is_forbidden_ip(ip_str):
+                error = f"Forbidden IP address: {ip_str}"
+                break
+        cached = (now + DNS_CACHE_TTL, error)
+        with _host_checks_lock:
+            _host_checks[hostname] = cached
+            _host_checks.move_to_end(hostname)
+            while len(_host_checks) > HOST_CHECK_CACHE_SIZE:
+                _host_checks.popitem(last=False)
+
+    if cached[1] is not None:
+        raise ValueError(cached[1])
+
+
+def validate_url(url):
+    """Validate URL format, scheme, hostname, IP address, and port.
 
+    The string checks are memoized per URL and the DNS check per hostname
+    (see ``_check_host``), so repeated checks within a batch are cheap.
+    """
+    try:
+        _check_host(_parse_target(url))
         return True
     except Exception as e:
-        logging.error("URL validation failed")
+        logger.error("URL validation failed")
         log_json(logger, logging.DEBUG, "URL validation failed", url=url, error=str(e))
         return False
 
 
+# Host -> monotonic time its next request may start
+_host_next_slot: Dict[str, float] = {}
+_host_slot_lock = threading.Lock()
+
+
+def _reserve_host_slot(url: str) -> float:
+    """Claim the next request slot for ``url``'s host; return seconds to wait.
+
+    Slots are spaced ``HOST_MIN_INTERVAL`` apart per host. The caller sleeps
+    outside the lock, so other hosts are never held up.
+    """
+    if HOST_MIN_INTERVAL <= 0:
+        return 0.0
+    host = parse_url(url).hostname or ""
+    with _host_slot_lock:
+        now = time.monotonic()
+        start = max(now, _host_next_slot.get(host, 0.0))
+        _host_next_slot[host] = start + HOST_MIN_INTERVAL
+    return start - now
+
+
+def _claim_host_slot(host: str) -> float:
+    """Claim ``host``'s request slot only if it is free now.
+
+    Returns 0.0 once claimed; otherwise the seconds until the slot frees, and
+    nothing is claimed. Lets a dispatcher hold a request back instead of
+    handing it to a worker that would sleep in ``_reserve_host_slot``.
+    """
+    if HOST_MIN_INTERVAL <= 0:
+        return 0.0
+    with _host_slot_lock:
+        now = time.monotonic()
+        wait = _host_next_slot.get(host, 0.0) - now
+        if wait > 0:
+            return wait
+        _host_next_slot[host] = now + HOST_MIN_INTERVAL
+    return 0.0
+
+
+def _cache_path(url: str) -> str:
+    """Return the cache file path for ``url``."""
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, key[:2], key)
+
+
+def _read_cached(url: str) -> Optional[bytes]:
+    """Return the cached body for ``url``, or None when absent or expired."""
+    if not CACHE_DIR:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL:
+            return None
+        with open(path, "rb") as f:
+            body = f.read()
+    except OSError:
+        return None
+    log_json(logger, logging.DEBUG, "Cache hit", url=url, response_size=len(body))
+    return body
+
+
+def _write_cached(url: str, body: bytes) -> None:
+    """Store ``body`` for ``url``; failures are logged and otherwise ignored."""
+    if not CACHE_DIR:
+        return
+    path = _cache_path(url)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        try:
+            f = open(tmp_path, "wb")
+        except FileNotFoundError:
+            # Shard directory is created on the first write into it only
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            f = open(tmp_path, "wb")
+        with f:
+            f.write(body)
+        # Atomic so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log_json(logger, logging.WARNING, "Cache write failed", url=url, error=str(e))
+
+
+class _BodyBuffer:
+    """Collects response chunks up to ``MAX_CONTENT_BYTES``.
+
+    Chunks are joined once at the end, and a body that arrived in a single
+    chunk is returned as is, so small pages are never copied.
+    """
+
+    __slots__ = ("url", "chunks", "size", "truncated")
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.truncated = False
+
+    def add(self, chunk: bytes) -> bool:
+        """Store ``chunk``; returns False once the limit is reached."""
+        room = MAX_CONTENT_BYTES - self.size
+        if len(chunk) <= room:
+            self.chunks.append(chunk)
+            self.size += len(chunk)
+            return True
+        self.chunks.append(chunk[:room])
+        self.size = MAX_CONTENT_BYTES
+        self.truncated = True
+        log_json(
+            logger,
+            logging.WARNING,
+            "Response truncated",
+            url=self.url,
+            max_bytes=MAX_CONTENT_BYTES,
+        )
+        return False
+
+    def getvalue(self) -> bytes:
+        if len(self.chunks) == 1:
+            return self.chunks[0]
+        return b"".join(self.chunks)
+
+    def cache(self, body: bytes) -> None:
+        """Store ``body`` in the response cache if it is complete and non-empty.
+
+        An empty or truncated response may be transient, so it is not served
+        from disk for the whole ``CACHE_TTL``.
+        """
+        if body and not self.truncated:
+            _write_cached(self.url, body)
+
+
+@functools.lru_cache(maxsize=None)
+def _http2_client():
+    """Create the shared HTTP/2 client on first use; returns ``(httpx, client)``.
+
+    Requires the optional ``httpx[http2]`` dependency.
+    """
+    try:
+        import httpx
+
+        client = httpx.Client(
+            # Connection-specific headers are not allowed in HTTP/2
+            headers={k: v for k, v in DEFAULT_HEADERS.items() if k != "Connection"},
+            # The transport retries failed connects; statuses are retried by
+            # _fetch_http2, as the requests session's Retry does
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=RETRY_TOTAL,
+                limits=httpx.Limits(
+                    max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE
+                ),
+            ),
+        )
+    except ImportError as e:
+        raise RuntimeError("httpx[http2] is required when SCRAPER_HTTP2 is set") from e
+    return httpx, client
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying after failed ``attempt`` (0-based).
+
+    A numeric ``Retry-After`` header wins; otherwise the backoff doubles from
+    ``BACKOFF_FACTOR`` up to ``RETRY_BACKOFF_MAX``.
+    """
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_BACKOFF_MAX)
+    return min(BACKOFF_FACTOR * (2**attempt), RETRY_BACKOFF_MAX)
+
+
+def _fetch_http2(url: str, headers: Dict[str, str], timeout: int) -> _BodyBuffer:
+    """Stream ``url`` through the shared HTTP/2 client.
+
+    Responses with a status in ``RETRY_STATUSES`` are retried up to
+    ``RETRY_TOTAL`` times with backoff, like the ``requests`` session. httpx
+    errors are re-raised as ``RequestException`` so callers handle and retry
+    them exactly like failures on the ``requests`` session.
+    """
+    httpx, client = _http2_client()
+    api_url = build_api_url(url)
+    attempt = 0
+    while True:
+        try:
+            with client.stream(
+                "GET", api_url, headers=headers, timeout=timeout
+            ) as response:
+                if response.status_code in RETRY_STATUSES and attempt < RETRY_TOTAL:
+                    delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                else:
+                    response.raise_for_status()
+                    buffer = _BodyBuffer(url)
+                    for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                        if not buffer.add(chunk):
+                            break
+                    return buffer
+        except httpx.HTTPError as e:
+            raise RequestException(str(e)) from e
+        time.sleep(delay)
+        attempt += 1
+
+
 def fetch_url(
     url: str,
     timeout: int = REQUEST_TIMEOUT,
     headers: Optional[Dict[str, str]] = None,
-) -> str:
-    """Fetch content from the URL and return the response text.
+    *,
+    _validate: bool = True,
+    _host_slot: bool = True,
+) -> bytes:
+    """Fetch content from the URL and return the raw response body.
+
+    The body is returned undecoded so the HTML parser can honour the document's
+    own charset declaration instead of paying for charset detection here. It is
+    streamed in chunks and truncated at ``MAX_CONTENT_BYTES`` so an oversized
+    page cannot exhaust memory. When ``SCRAPER_CACHE_DIR`` is set, bodies are
+    served from and stored in the on-disk cache for ``SCRAPER_CACHE_TTL``
+    seconds. When ``SCRAPER_HTTP2`` is set, requests go through a shared
+    HTTP/2 ``httpx`` client instead of the ``requests`` session. When
+    ``SCRAPER_HOST_INTERVAL`` is set, requests to the same host are spaced at
+    least that many seconds apart.
 
     Args:
         url: Target URL to fetch.
         timeout: Request timeout in seconds.
         headers: Optional dictionary of additional HTTP headers. User-provided values
             override defaults.
+        _validate: Internal flag; callers that already validated ``url`` pass
+            ``False`` to skip the repeated check.
+        _host_slot: Internal flag; callers that already claimed the host's
+            request slot pass ``False`` so it is not reserved twice.
     """
-    if not validate_url(url):  # ADDED: URL validation
+    if _validate and not validate_url(url):  # ADDED: URL validation
         raise ValueError(f"Invalid URL: {url}")
 
-    base_headers = {
-        "User-Agent": get_random_user_agent(),
-        "Accept": (
-            "text/html,application/xhtml+xml,application/xml;q=0.9,"
-            "image/avif,image/webp,*/*;q=0.8"
-        ),
-        "Accept-Language": "en-US,en;q=0.9",
-        "Connection": "close",
-        "DNT": "1",
-        "Upgrade-Insecure-Requests": "1",
-    }
-    if headers:
-        base_headers.update(headers)
-    log_json(logger, logging.DEBUG, "Fetching URL", url=url, headers=base_headers)
+    cached = _read_cached(url)
+    if cached is not None:
+        return cached
+
+    wait = _reserve_host_slot(url) if _host_slot else 0.0
+    if wait:
+        time.sleep(wait)
+
+    base_headers = build_request_headers(headers)
+    # Guarded at the call site too: this runs per request, and skipping it
+    # avoids building the kwargs dict when DEBUG is off
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        log_json(logger, logging.DEBUG, "Fetching URL", url=url, headers=base_headers)
 
     try:
-        response = session.get(
-            SCRAPERAPI_URL + url, headers=base_headers, timeout=timeout
-        )
-        response.raise_for_status()
-        log_json(
-            logger,
-            logging.DEBUG,
-            "URL fetched successfully",
-            url=url,
-            response_size=len(response.content),
-        )
-        return response.text
+        if USE_HTTP2:
+            buffer = _fetch_http2(url, base_headers, timeout)
+        else:
+            response = session.get(
+                build_api_url(url), headers=base_headers, timeout=timeout, stream=True
+            )
+            try:
+                response.raise_for_status()
+                buffer = _BodyBuffer(url)
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    if not buffer.add(chunk):
+                        break
+            finally:
+                response.close()
+        if debug:
+            log_json(
+                logger,
+                logging.DEBUG,
+                "URL fetched successfully",
+                url=url,
+                response_size=buffer.size,
+            )
+        body = buffer.getvalue()
+        buffer.cache(body)
+        return body
     except (HTTPError, Timeout, TooManyRedirects) as e:
-        logging.error("HTTP/Network error occurred while fetching URL")
+        logger.error("HTTP/Network error occurred while fetching URL")
         log_json(
             logger,
             logging.DEBUG,
@@ -160,7 +607,7 @@ def fetch_url(
         )
         raise
     except RequestException as e:  # IMPROVED: More specific exception handling
-        logging.error("Request error occurred while fetching URL")
+        logger.error("Request error occurred while fetching URL")
         log_json(
             logger,
             logging.DEBUG,
@@ -170,7 +617,7 @@ def fetch_url(
         )
         raise
     except Exception as e:
-        logging.error("Unexpected error occurred while fetching URL")
+        logger.error("Unexpected error occurred while fetching URL")
         log_json(
             logger,
             logging.DEBUG,
@@ -186,16 +633,25 @@ def get_page_content(
     retries: int = PAGE_RETRIES,
     delay: int = RETRY_DELAY,
     timeout: int = REQUEST_TIMEOUT,
-) -> Optional[str]:
-    """Fetch page content with retries and exponential backoff."""
-    if not validate_url(url):  # ADDED: URL validation
-        logging.error("Invalid URL provided")
+    *,
+    _validate: bool = True,
+    _host_slot: bool = True,
+) -> Optional[bytes]:
+    """Fetch page content with retries and exponential backoff.
+
+    ``_host_slot`` is an internal flag for the first attempt; see ``fetch_url``.
+    Retries always reserve a fresh slot.
+    """
+    if _validate and not validate_url(url):  # ADDED: URL validation
+        logger.error("Invalid URL provided")
         log_json(logger, logging.DEBUG, "Invalid URL provided", url=url)
         return None
 
     for attempt in range(retries):
         try:
-            return fetch_url(url, timeout)
+            return fetch_url(
+                url, timeout, _validate=False, _host_slot=_host_slot or attempt > 0
+            )
         except RequestException as e:  # IMPROVED: More specific exception handling
             log_json(
                 logger,
@@ -208,10 +664,10 @@ def get_page_content(
             )
             if attempt < retries - 1:  # Don't sleep on the last attempt
                 sleep_time = delay * (2**attempt)
-                logging.debug(f"Waiting {sleep_time} seconds before retry...")
+                logger.debug("Waiting %s seconds before retry...", sleep_time)
                 time.sleep(sleep_time)
         except Exception as e:
-            logging.error("Unexpected error occurred while fetching URL")
+            logger.error("Unexpected error occurred while fetching URL")
             log_json(
                 logger,
                 logging.DEBUG,
@@ -224,7 +680,7 @@ def get_page_content(
             if attempt < retries - 1:
                 time.sleep(delay * (2**attempt))
 
-    logging.error("Failed to fetch URL after retries")
+    logger.error("Failed to fetch URL after retries")
     log_json(
         logger,
         logging.DEBUG,
@@ -235,92 +691,268 @@ def get_page_content(
     return None
 
 
-def scrape_text_data(url):
-    """Scrape text data from the specified URL."""
+def scrape_text_data(url, *, _validate: bool = True, _host_slot: bool = True):
+    """Scrape text data from the specified URL.
+
+    ``_validate`` and ``_host_slot`` are internal flags; see ``fetch_url``.
+    """
     log_json(logger, logging.DEBUG, "Start scraping text data", url=url)
 
-    if not validate_url(url):  # ADDED: URL validation
-        logging.error("Invalid URL provided")
+    if _validate and not validate_url(url):  # ADDED: URL validation
+        logger.error("Invalid URL provided")
         log_json(logger, logging.DEBUG, "Invalid URL provided", url=url)
         return None
 
-    page_content = get_page_content(url)
+    page_content = get_page_content(url, _validate=False, _host_slot=_host_slot)
     if not page_content:
-        logging.error("Failed to retrieve content from URL")
+        logger.error("Failed to retrieve content from URL")
         log_json(logger, logging.DEBUG, "Failed to retrieve content", url=url)
         return None
 
-    try:
-        soup = BeautifulSoup(page_content, "html.parser")
-
-        # IMPROVED: Better title extraction with fallbacks
-        title = "No title found"
-        if soup.title and soup.title.string:
-            title = soup.title.string.strip()
-        elif soup.find("h1"):
-            title = soup.find("h1").get_text(strip=True)
-
-        content = []
-
-        # IMPROVED: More comprehensive content extraction
-        content_selectors = [
-            "article",
-            "main",
-            ".content",
-            "#content",  # Common content containers
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",  # Headers
-            "p",
-            "div",
-            "span",
-            "li",  # Text content
-            "code",
-            "pre",  # Code blocks
-            "blockquote",
-            "q",  # Quotes
-        ]
+    return _parse_html(page_content, url)
+
+
+def _format_element(tag_name: str, text: str) -> str:
+    """Render an extracted element's text according to its tag type."""
+    if tag_name in CODE_TAGS:
+        return f"\n{text}\n"
+    if tag_name in QUOTE_TAGS:
+        return f"> {text}"
+    marker = HEADER_MARKERS.get(tag_name)
+    if marker:
+        return f"\n{marker} {text}\n"
+    return text
+
+
+def _main_content_rank(tag_name: str, classes, element_id) -> Optional[int]:
+    """Return the priority of a main content candidate (0 is best), or None."""
+    if tag_name in MAIN_CONTENT_TAGS:
+        return 0
+    if classes and not MAIN_CONTENT_NAMES.isdisjoint(classes):
+        return 1
+    if element_id in MAIN_CONTENT_NAMES:
+        return 2
+    return None
+
+
+def _pick_main_content(candidates):
+    """Pick the best ``(rank, element)`` candidate, first in document order.
+
+    Stops at the first rank 0 match, so the document is walked at most once.
+    """
+    best_rank, best = 3, None
+    for rank, element in candidates:
+        if rank is not None and rank < best_rank:
+            best_rank, best = rank, element
+            if rank == 0:
+                break
+    return best
+
+
+@functools.lru_cache(maxsize=None)
+def _bs4_content_selector():
+    """Compile ``CONTENT_SELECTOR`` with soupsieve once, on first use."""
+    import soupsieve
+
+    return soupsieve.compile(CONTENT_SELECTOR)
+
 
-        # Try to find main content area first
-        main_content = (
-            soup.find(["article", "main"])
-            or soup.find(class_=["content", "main-content"])
-            or soup.find(id=["content", "main-content"])
+def _extract_with_bs4(page_content: Union[str, bytes]) -> Tuple[str, List[str], str]:
+    """Extract ``(title, content, body_text)`` using BeautifulSoup.
+
+    ``body_text`` is only computed when no structured content was found.
+    """
+    # Imported here so the selectolax path never pays for loading bs4
+    from bs4 import BeautifulSoup, Tag
+
+    soup = BeautifulSoup(page_content, HTML_PARSER)
+
+    # IMPROVED: Better title extraction with fallbacks
+    title = "No title found"
+    title_tag = soup.title
+    if title_tag and title_tag.string:
+        title = title_tag.string.strip()
+    else:
+        h1 = soup.find("h1")
+        if h1:
+            title = h1.get_text(strip=True)
+
+    content = []
+
+    # Try to find main content area first
+    main_content = _pick_main_content(
+        (_main_content_rank(tag.name, tag.get("class"), tag.get("id")), tag)
+        for tag in soup.descendants
+        if isinstance(tag, Tag)
+    )
+    search_area = main_content if main_content else soup
+
+    # SECURITY: ensure search_area is a BeautifulSoup Tag to prevent attribute errors
+    if isinstance(search_area, (Tag, BeautifulSoup)):
+        tags = _bs4_content_selector().select(search_area)
+    else:
+        tags = []
+
+    for tag in tags:  # Skip container selectors for individual elements
+        if tag.name in SKIP_TAGS:  # Skip unwanted elements
+            continue
+
+        text = tag.get_text(separator=" ", strip=True)
+        if len(text) > 10:  # Filter out very short or empty content (already stripped)
+            content.append(_format_element(tag.name, text))
+
+    body_text = "" if content else soup.get_text(separator=" ", strip=True)
+    return title, content, body_text
+
+
+def _selectolax_text(node) -> str:
+    """Join the stripped, non-empty text nodes under ``node`` with spaces.
+
+    Matches BeautifulSoup's ``get_text(separator=" ", strip=True)``; lexbor's
+    own ``strip=True`` keeps the empty strings, leaving runs of separators.
+    The parser never emits NUL characters, so it is safe as a delimiter.
+    """
+    return " ".join(filter(None, node.text(separator="\x00", strip=True).split("\x00")))
+
+
+def _extract_with_selectolax(page_content: Union[str, bytes]) -> Tuple[str, List[str], str]:
+    """Extract ``(title, content, body_text)`` using selectolax's lexbor parser.
+
+    Mirrors ``_extract_with_bs4`` but parses and selects in C without building
+    a Python object per tag.
+    """
+    # encoding=True makes byte input honour its BOM or <meta charset>
+    tree = LexborHTMLParser(page_content, encoding=True)
+    # BeautifulSoup's get_text skips script/style strings; drop them to match
+    tree.strip_tags(["script", "style"])
+
+    title = "No title found"
+    title_node = tree.css_first("title")
+    h1_node = tree.css_first("h1")
+    if title_node and title_node.text(strip=True):
+        title = title_node.text(strip=True)
+    elif h1_node:
+        title = h1_node.text(strip=True)
+
+    content = []
+
+    main_content = _pick_main_content(
+        (
+            _main_content_rank(
+                node.tag,
+                (node.attributes.get("class") or "").split(),
+                node.attributes.get("id"),
+            ),
+            node,
         )
-        search_area = main_content if main_content else soup
+        for node in tree.css(MAIN_CONTENT_SELECTOR)
+    )
+    search_area = main_content if main_content else tree.root
 
-        selectors = ", ".join(content_selectors[4:])
-        # SECURITY: ensure search_area is a BeautifulSoup Tag to prevent attribute errors
-        if isinstance(search_area, (Tag, BeautifulSoup)):
-            tags = search_area.select(selectors)
-        else:
-            tags = []
-
-        for tag in tags:  # Skip container selectors for individual elements
-            if tag.name in [
-                "script",
-                "style",
-                "nav",
-                "header",
-                "footer",
-            ]:  # Skip unwanted elements
+    if search_area is not None:
+        for node in search_area.css(CONTENT_SELECTOR):
+            # Unlike soupsieve, lexbor matches the search root itself
+            if node == main_content:
                 continue
+            text = _selectolax_text(node)
+            if len(text) > 10:  # Already stripped
+                content.append(_format_element(node.tag, text))
 
-            text = tag.get_text(separator=" ", strip=True)
-            if (
-                text and len(text.strip()) > 10
-            ):  # Filter out very short or empty content
-                if tag.name in ["code", "pre"]:
-                    content.append(f"\n{text}\n")
-                elif tag.name in ["blockquote", "q"]:
-                    content.append(f"> {text}")
-                elif tag.name.startswith("h"):
-                    content.append(f'\n{"#" * int(tag.name[1])} {text}\n')
-                else:
-                    content.append(text)
+    body_text = ""
+    if not content and tree.root is not None:
+        body_text = _selectolax_text(tree.root)
+    return title, content, body_text
+
+
+@functools.lru_cache(maxsize=None)
+def _lxml_tools():
+    """Import ``lxml.html`` and compile the extraction XPaths once, on first use.
+
+    Together these play the role of precompiled CSS selectors for the content
+    and main content lookups, without needing the ``cssselect`` package.
+    """
+    import lxml.html
+    from lxml import etree
+
+    tags = [tag.strip() for tag in CONTENT_SELECTOR.split(",")]
+    content_xpath = etree.XPath(
+        "descendant::*[" + " or ".join(f"self::{tag}" for tag in tags) + "]"
+    )
+    # Main content candidates in document order; _pick_main_content ranks them
+    main_tests = [f"self::{tag}" for tag in sorted(MAIN_CONTENT_TAGS)]
+    main_tests += [
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+        for name in sorted(MAIN_CONTENT_NAMES)
+    ]
+    main_tests += [f"@id = '{name}'" for name in sorted(MAIN_CONTENT_NAMES)]
+    main_xpath = etree.XPath("//*[" + " or ".join(main_tests) + "]")
+    # Mirrors BeautifulSoup's get_text, which skips script/style strings
+    text_xpath = etree.XPath(
+        "descendant-or-self::text()[not(ancestor::script or ancestor::style)]"
+    )
+    return lxml.html, etree, content_xpath, main_xpath, text_xpath
+
+
+def _extract_with_lxml(page_content: Union[str, bytes]) -> Tuple[str, List[str], str]:
+    """Extract ``(title, content, body_text)`` using lxml's compiled XPath.
+
+    Mirrors ``_extract_with_bs4``; used when selectolax is unavailable.
+    """
+    lxml_html, etree, content_xpath, main_xpath, text_xpath = _lxml_tools()
+
+    def _text(element) -> str:
+        # map/filter keep the per-string strip and empty check in C
+        return " ".join(filter(None, map(str.strip, text_xpath(element))))
+
+    title = "No title found"
+    try:
+        root = lxml_html.document_fromstring(page_content)
+    except etree.ParserError:  # Empty or whitespace-only document
+        return title, [], ""
+
+    title_node = root.find(".//title")
+    title_text = _text(title_node) if title_node is not None else ""
+    if title_text:
+        title = title_text
+    else:
+        h1_node = root.find(".//h1")
+        if h1_node is not None:
+            title = _text(h1_node)
+
+    main_content = _pick_main_content(
+        (
+            _main_content_rank(
+                element.tag, (element.get("class") or "").split(), element.get("id")
+            ),
+            element,
+        )
+        for element in main_xpath(root)
+    )
+    search_area = main_content if main_content is not None else root
+
+    content = []
+    for element in content_xpath(search_area):
+        text = _text(element)
+        if len(text) > 10:  # Already stripped
+            content.append(_format_element(element.tag, text))
+
+    body_text = "" if content else _text(root)
+    return title, content, body_text
+
+
+def _parse_html(page_content: Union[str, bytes], url: str) -> Optional[str]:
+    """Extract the title and readable text from ``page_content``.
+
+    Uses selectolax when it is installed, then lxml, then BeautifulSoup.
+    ``url`` is only used for logging context.
+    """
+    try:
+        if LexborHTMLParser is not None:
+            title, content, body_text = _extract_with_selectolax(page_content)
+        elif HTML_PARSER == "lxml":
+            title, content, body_text = _extract_with_lxml(page_content)
+        else:
+            title, content, body_text = _extract_with_bs4(page_content)
 
         if not content:  # Fallback if no content found
             log_json(
@@ -329,10 +961,10 @@ def scrape_text_data(url):
                 "No structured content found",
                 url=url,
             )
-            body_text = soup.get_text(separator=" ", strip=True)
             content = [body_text] if body_text else ["No content found"]
 
-        full_content = f"Title: {title}\n\n" + "\n".join(content)
+        # One join over the title and elements; no second concatenation copy
+        full_content = "\n".join([f"Title: {title}\n", *content])
         log_json(
             logger,
             logging.DEBUG,
@@ -343,7 +975,7 @@ def scrape_text_data(url):
         return full_content.strip()
 
     except Exception as e:
-        logging.error("Error parsing content from URL")
+        logger.error("Error parsing content from URL")
         log_json(
             logger,
             logging.DEBUG,
@@ -357,7 +989,7 @@ def scrape_text_data(url):
 def save_data_to_file(data: str, filename: str, file_format: str = "txt") -> bool:
     """Save data to a file with the specified format."""
     if not data:
-        logging.warning(f"No data to save for {filename}")
+        logger.warning("No data to save for %s", filename)
         return False
 
     try:
@@ -368,82 +1000,161 @@ def save_data_to_file(data: str, filename: str, file_format: str = "txt") -> boo
         elif file_format == "md":
             filename = base_name + ".md"
         else:
-            logging.warning(
-                f"Unsupported file format: {file_format}, defaulting to txt"
+            logger.warning(
+                "Unsupported file format: %s, defaulting to txt", file_format
             )
             filename = base_name + ".txt"
 
-        # ADDED: Create directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(filename) if os.path.dirname(filename) else ".",
-            exist_ok=True,
-        )
-
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(data)
-        logging.info(f"Successfully saved {len(data)} characters to {filename}")
+        # Encode once and write the bytes straight to the descriptor,
+        # bypassing the buffered text layer
+        payload = memoryview(data.encode("utf-8"))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(filename, flags, 0o666)
+        except FileNotFoundError:
+            # ADDED: Create directory if it doesn't exist; only checked on a miss
+            os.makedirs(
+                os.path.dirname(filename) if os.path.dirname(filename) else ".",
+                exist_ok=True,
+            )
+            fd = os.open(filename, flags, 0o666)
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload) :]
+        finally:
+            os.close(fd)
+        logger.info("Successfully saved %d characters to %s", len(data), filename)
         return True
 
     except Exception as e:
-        logging.error("Failed to save data to file")
-        logging.debug("Failed to save data to %s: %s", filename, e)
+        logger.error("Failed to save data to file")
+        logger.debug("Failed to save data to %s: %s", filename, e)
         return False
 
 
-def scrape_multiple_urls(
-    urls: List[str], max_workers: int = 3
-) -> List[str]:  # IMPROVED: Reduced default workers to be more respectful
-    """Scrape multiple URLs concurrently with improved error handling."""
-    if not urls:
-        logging.warning("No URLs provided for scraping")
-        return []
+def iter_scrape_results(
+    urls: List[str],
+    max_workers: int = 3,
+    parse_executor: Optional[concurrent.futures.Executor] = None,
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """Scrape URLs concurrently, yielding ``(url, content)`` as each one finishes.
 
-    # Filter out invalid URLs
-    valid_urls = [url for url in urls if validate_url(url)]
-    invalid_count = len(urls) - len(valid_urls)
+    Results arrive in completion order, so one slow URL does not hold back the
+    others. ``content`` is None when scraping failed. Invalid URLs are logged
+    and skipped without being yielded.
 
-    if invalid_count > 0:
-        logging.warning(f"Skipped {invalid_count} invalid URLs")
+    Args:
+        urls: URLs to scrape.
+        max_workers: Number of threads fetching pages.
+        parse_executor: Optional executor for HTML parsing. Pass a
+            ``ProcessPoolExecutor`` to parse on other cores, outside the GIL; the
+            fetch threads then only download. When None, each thread fetches
+            and parses its own page.
+    """
+    if not urls:
+        logger.warning("No URLs provided for scraping")
+        return
 
-    if not valid_urls:
-        logging.error("No valid URLs to scrape")
-        return []
+    # All workers share the session's pool; more threads than pooled
+    # connections would open and discard extra connections on every request
+    max_workers = min(max_workers, POOL_SIZE)
 
-    logging.info(
-        f"Starting concurrent scraping of {len(valid_urls)} URLs with {max_workers} workers"
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="scraper-fetch"
     )
+    parse_futures = set()
+    future_to_url = {}
+    # Host -> URLs held back until that host's next request slot (see
+    # HOST_MIN_INTERVAL), so no worker thread sleeps waiting for it
+    held: Dict[str, Deque[str]] = {}
+    try:
+        # With a parse executor the threads only fetch; either way they skip
+        # re-validation, and the host slot is claimed here before submitting.
+        if parse_executor is None:
+            task = functools.partial(
+                scrape_text_data, _validate=False, _host_slot=False
+            )
+        else:
+            task = functools.partial(
+                get_page_content, _validate=False, _host_slot=False
+            )
 
-    results = []
-    failed_urls = []
+        # Validate and submit in a single pass, so the first fetches start
+        # while later URLs are still being checked
+        valid_count = 0
+        for url in urls:
+            if not validate_url(url):
+                continue
+            valid_count += 1
+            host = parse_url(url).hostname or ""
+            if host in held:
+                held[host].append(url)
+            elif _claim_host_slot(host):
+                held[host] = deque([url])
+            else:
+                future_to_url[executor.submit(task, url)] = url
+
+        invalid_count = len(urls) - valid_count
+        if invalid_count > 0:
+            logger.warning("Skipped %d invalid URLs", invalid_count)
+
+        if not valid_count:
+            logger.error("No valid URLs to scrape")
+            return
+
+        logger.info(
+            "Starting concurrent scraping of %d URLs with %d workers",
+            valid_count,
+            max_workers,
+        )
 
-    try:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_url = {
-                executor.submit(scrape_text_data, url): url for url in valid_urls
-            }
-
-            # Process completed tasks
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
+        # Process completed tasks from both stages as they finish, submitting
+        # held URLs as their hosts' slots come up
+        while future_to_url or held:
+            next_slot = None
+            for host in list(held):
+                wait = _claim_host_slot(host)
+                if not wait:
+                    queue = held[host]
+                    url = queue.popleft()
+                    future_to_url[executor.submit(task, url)] = url
+                    if not queue:
+                        del held[host]
+                        continue
+                    wait = HOST_MIN_INTERVAL
+                next_slot = wait if next_slot is None else min(next_slot, wait)
+
+            if not future_to_url:
+                time.sleep(next_slot)
+                continue
+            done, _ = concurrent.futures.wait(
+                future_to_url,
+                timeout=next_slot,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                url = future_to_url.pop(future)
                 try:
-                    result = future.result(timeout=60)  # 60 second timeout per URL
-                    if result:
-                        results.append(result)
-                    else:
-                        failed_urls.append(url)
+                    # Already done; network timeouts are enforced per request
+                    result = future.result()
+                    if (
+                        result
+                        and parse_executor is not None
+                        and future not in parse_futures
+                    ):
+                        parse_future = parse_executor.submit(_parse_html, result, url)
+                        parse_futures.add(parse_future)
+                        future_to_url[parse_future] = url
+                        continue
+                    if not result:
                         log_json(
                             logger,
                             logging.WARNING,
                             "No content scraped",
                             url=url,
                         )
-                except concurrent.futures.TimeoutError:
-                    logging.error("Timeout occurred while scraping URL")
-                    log_json(logger, logging.DEBUG, "Timeout scraping", url=url)
-                    failed_urls.append(url)
                 except Exception as e:
-                    logging.error("Error occurred while scraping URL")
+                    logger.error("Error occurred while scraping URL")
                     log_json(
                         logger,
                         logging.DEBUG,
@@ -451,15 +1162,57 @@ def scrape_multiple_urls(
                         url=url,
                         error=str(e),
                     )
-                    failed_urls.append(url)
+                    result = None
+                yield url, result
 
     except Exception as e:
-        logging.error("Error occurred during concurrent scraping")
-        logging.debug("Error in concurrent scraping: %s", e)
+        logger.error("Error occurred during concurrent scraping")
+        logger.debug("Error in concurrent scraping: %s", e)
+    finally:
+        # Also reached when the caller stops iterating early: queued fetches
+        # and parses are cancelled rather than run for nobody
+        for future in parse_futures:
+            future.cancel()
+        executor.shutdown(cancel_futures=True)
+
+
+def scrape_multiple_urls(
+    urls: List[str],
+    max_workers: int = 3,  # IMPROVED: Reduced default workers to be more respectful
+    parse_executor: Optional[concurrent.futures.Executor] = None,
+    use_async: bool = False,
+) -> List[str]:
+    """Scrape multiple URLs concurrently with improved error handling.
+
+    See ``iter_scrape_results`` for ``parse_executor``. With ``use_async``, the
+    URLs are fetched on one event loop by ``scrape_multiple_urls_async`` instead
+    of a thread pool, with ``max_workers`` requests in flight. That path needs
+    ``aiohttp`` and must not be called from a running event loop.
+    """
+    if use_async:
+        return asyncio.run(
+            scrape_multiple_urls_async(
+                urls, concurrency=max_workers, parse_executor=parse_executor
+            )
+        )
+
+    results = []
+    failed_urls = []
+
+    for url, result in iter_scrape_results(urls, max_workers, parse_executor):
+        if result:
+            results.append(result)
+        else:
+            failed_urls.append(url)
+
+    if not results and not failed_urls:
+        return results
 
     success_count = len(results)
-    logging.info(
-        f"Scraping completed: {success_count} successful, {len(failed_urls)} failed"
+    logger.info(
+        "Scraping completed: %d successful, %d failed",
+        success_count,
+        len(failed_urls),
     )
 
     if failed_urls:
@@ -474,30 +1227,385 @@ def scrape_multiple_urls(
     return results
 
 
+def _import_aiohttp():
+    """Import ``aiohttp`` on first use and return it."""
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError as e:
+            raise RuntimeError("aiohttp is required for asynchronous scraping") from e
+        aiohttp = module
+    return aiohttp
+
+
+async def fetch_url_async(
+    client: "aiohttp.ClientSession",
+    url: str,
+    timeout: int = REQUEST_TIMEOUT,
+    headers: Optional[Dict[str, str]] = None,
+    *,
+    _validate: bool = True,
+    _limit: Optional[asyncio.Semaphore] = None,
+) -> bytes:
+    """Asynchronously fetch content from the URL and return the raw response body.
+
+    Args:
+        client: Shared ``aiohttp.ClientSession`` used for connection pooling.
+        url: Target URL to fetch.
+        timeout: Request timeout in seconds.
+        headers: Optional dictionary of additional HTTP headers. User-provided values
+            override defaults.
+        _validate: Internal flag; see ``fetch_url``.
+        _limit: Internal; a semaphore held only while the request is in
+            flight, not while waiting for the host's request slot.
+    """
+    _import_aiohttp()
+    if _validate and not validate_url(url):
+        raise ValueError(f"Invalid URL: {url}")
+
+    cached = _read_cached(url)
+    if cached is not None:
+        return cached
+
+    wait = _reserve_host_slot(url)
+    if wait:
+        await asyncio.sleep(wait)
+
+    base_headers = build_request_headers(headers)
+    debug = logger.isEnabledFor(logging.DEBUG)  # See fetch_url
+    if debug:
+        log_json(logger, logging.DEBUG, "Fetching URL", url=url, headers=base_headers)
+
+    if _limit is not None:
+        await _limit.acquire()
+    try:
+        async with client.get(
+            build_api_url(url),
+            headers=base_headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response.raise_for_status()
+            buffer = _BodyBuffer(url)
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                if not buffer.add(chunk):
+                    break
+    finally:
+        if _limit is not None:
+            _limit.release()
+    if debug:
+        log_json(
+            logger,
+            logging.DEBUG,
+            "URL fetched successfully",
+            url=url,
+            response_size=buffer.size,
+        )
+    body = buffer.getvalue()
+    buffer.cache(body)
+    return body
+
+
+async def get_page_content_async(
+    client: "aiohttp.ClientSession",
+    url: str,
+    retries: int = PAGE_RETRIES,
+    delay: int = RETRY_DELAY,
+    timeout: int = REQUEST_TIMEOUT,
+    *,
+    _validate: bool = True,
+    _limit: Optional[asyncio.Semaphore] = None,
+) -> Optional[bytes]:
+    """Asynchronously fetch page content with retries and exponential backoff.
+
+    ``_limit`` is internal; see ``fetch_url_async``.
+    """
+    _import_aiohttp()
+    if _validate and not validate_url(url):
+        logger.error("Invalid URL provided")
+        log_json(logger, logging.DEBUG, "Invalid URL provided", url=url)
+        return None
+
+    for attempt in range(retries):
+        try:
+            return await fetch_url_async(
+                client, url, timeout, _validate=False, _limit=_limit
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log_json(
+                logger,
+                logging.WARNING,
+                "Request error fetching",
+                url=url,
+                error=str(e),
+                attempt=attempt + 1,
+                retries=retries,
+            )
+        except Exception as e:
+            logger.error("Unexpected error occurred while fetching URL")
+            log_json(
+                logger,
+                logging.DEBUG,
+                "Unexpected error fetching",
+                url=url,
+                error=str(e),
+                attempt=attempt + 1,
+                retries=retries,
+            )
+        if attempt < retries - 1:  # Don't sleep on the last attempt
+            await asyncio.sleep(delay * (2**attempt))
+
+    logger.error("Failed to fetch URL after retries")
+    log_json(
+        logger,
+        logging.DEBUG,
+        "Failed to fetch after retries",
+        url=url,
+        retries=retries,
+    )
+    return None
+
+
+async def iter_scrape_results_async(
+    urls: List[str],
+    concurrency: int = ASYNC_CONCURRENCY,
+    parse_executor: Optional[concurrent.futures.Executor] = None,
+) -> AsyncIterator[Tuple[str, Optional[str]]]:
+    """Scrape URLs on the running event loop, yielding ``(url, content)``.
+
+    The asyncio counterpart of ``iter_scrape_results``: results arrive in
+    completion order, ``content`` is None when scraping failed, and invalid
+    URLs are logged and skipped. Each task validates its URL in the loop's
+    default thread pool, so blocking DNS lookups never stall the loop. Up to
+    ``concurrency`` requests are in flight at once over one pooled ``aiohttp``
+    session. HTML parsing is handed to
+    ``parse_executor`` (the loop's default thread pool when None; pass a
+    ``ProcessPoolExecutor`` to parse outside the GIL) so it does not block the
+    loop. Closing the generator early cancels the requests still pending.
+    Requires the optional ``aiohttp`` dependency.
+    """
+    _import_aiohttp()
+
+    if not urls:
+        logger.warning("No URLs provided for scraping")
+        return
+
+    logger.info(
+        "Starting async scraping of %d URLs with concurrency %d",
+        len(urls),
+        concurrency,
+    )
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(
+        client: "aiohttp.ClientSession", url: str
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        # None marks an invalid URL; validate_url resolves DNS, which blocks
+        if not await loop.run_in_executor(None, validate_url, url):
+            return None
+        try:
+            # The semaphore is taken per request inside fetch_url_async, so
+            # waits for a busy host's slot or a retry do not hold it
+            page_content = await get_page_content_async(
+                client, url, _validate=False, _limit=semaphore
+            )
+            content = None
+            if page_content:
+                content = await loop.run_in_executor(
+                    parse_executor, _parse_html, page_content, url
+                )
+        except Exception as e:
+            logger.error("Error occurred while scraping URL")
+            log_json(logger, logging.DEBUG, "Error scraping", url=url, error=str(e))
+            return url, None
+        if not content:
+            log_json(logger, logging.WARNING, "No content scraped", url=url)
+        return url, content
+
+    # Every request goes to the ScraperAPI host, so no per-host limit is set;
+    # it would otherwise cap the effective concurrency.
+    connector = aiohttp.TCPConnector(limit=max(100, concurrency), ttl_dns_cache=300)
+    async with aiohttp.ClientSession(
+        connector=connector, headers=DEFAULT_HEADERS
+    ) as client:
+        tasks = [asyncio.create_task(_bounded(client, url)) for url in urls]
+        invalid_count = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is None:
+                    invalid_count += 1
+                    continue
+                yield result
+        finally:
+            if invalid_count:
+                logger.warning("Skipped %d invalid URLs", invalid_count)
+            if invalid_count == len(urls):
+                logger.error("No valid URLs to scrape")
+            for task in tasks:
+                task.cancel()
+            # Let the cancellations finish before the session closes, so no
+            # task or connection outlives it
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def scrape_multiple_urls_async(
+    urls: List[str],
+    concurrency: int = ASYNC_CONCURRENCY,
+    parse_executor: Optional[concurrent.futures.Executor] = None,
+) -> List[str]:
+    """Scrape multiple URLs on a single event loop.
+
+    See ``iter_scrape_results_async`` for the arguments. Requires the optional
+    ``aiohttp`` dependency.
+    """
+    results = []
+    failed_urls = []
+    async for url, content in iter_scrape_results_async(
+        urls, concurrency, parse_executor
+    ):
+        if content:
+            results.append(content)
+        else:
+            failed_urls.append(url)
+
+    if not results and not failed_urls:
+        return results
+
+    logger.info(
+        "Scraping completed: %d successful, %d failed",
+        len(results),
+        len(failed_urls),
+    )
+
+    if failed_urls:
+        log_json(
+            logger,
+            logging.WARNING,
+            "Failed URLs",
+            urls=[sanitize_url(u) for u in failed_urls],
+        )
+
+    return results
+
+
+async def _drain_async_results(
+    results: AsyncIterator[Tuple[str, Optional[str]]],
+    handle: Callable[[str, Optional[str]], Awaitable[None]],
+    stop_event: Optional[threading.Event],
+) -> None:
+    """Await ``handle`` for each result until exhausted or ``stop_event`` is set."""
+    try:
+        async for url, content in results:
+            await handle(url, content)
+            if stop_event is not None and stop_event.is_set():
+                break
+    finally:
+        await results.aclose()  # Cancels whatever is still in flight
+
+
 # ADDED: Utility function for batch processing
+@functools.lru_cache(maxsize=1024)
+def _safe_host_name(netloc: str) -> str:
+    """Filename-safe form of ``netloc``; cached, as batches repeat hosts."""
+    return UNDERSCORE_RUN.sub("_", netloc.translate(FILENAME_TRANSLATION))
+
+
 def scrape_urls_to_files(
     urls: List[str],
     output_dir: str = "scraped_data",
     file_format: str = "txt",
     max_workers: int = 3,
+    parse_executor: Optional[concurrent.futures.Executor] = None,
+    use_async: bool = False,
+    on_result: Optional[Callable[[str, bool], None]] = None,
+    stop_event: Optional[threading.Event] = None,
 ) -> List[str]:
-    """Scrape URLs and save each to a separate file."""
+    """Scrape URLs and save each to a separate file.
+
+    See ``iter_scrape_results`` for ``parse_executor``. With ``use_async`` the
+    pages are fetched by ``iter_scrape_results_async`` on a private event loop,
+    ``max_workers`` at a time. ``on_result(url, ok)`` is called from the
+    scraping thread as each URL finishes. Setting ``stop_event`` stops the run
+    after the current page; on the async path pending requests are cancelled.
+    """
     if not urls:
         return []
 
     os.makedirs(output_dir, exist_ok=True)
-    results = scrape_multiple_urls(urls, max_workers)
-    saved_files = []
+    # Join the directory once; per-file paths are then a plain concatenation
+    output_prefix = os.path.join(output_dir, "")
+    # Number files by each URL's position in the input, not completion order.
+    # Repeated URLs are scraped once, so no two writes target the same file.
+    positions: Dict[str, int] = {}
+    for i, url in enumerate(urls):
+        positions.setdefault(url, i)
+    urls = list(positions)
+    write_futures = []
+    # Bounds pages held in memory waiting for the disk; when writes fall
+    # behind, result collection (and so fetching) pauses until one lands
+    write_slots = threading.BoundedSemaphore(MAX_PENDING_WRITES)
+
+    # Writes run on a small dedicated pool so disk I/O never stalls the loop
+    # collecting scrape results; each page is handed off as soon as it arrives
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="scraper-io"
+    ) as io_pool:
+
+        def submit_write(url: str, content: str) -> concurrent.futures.Future:
+            # Generate filename from URL; the parse is cached from validation
+            safe_host = _safe_host_name(parse_url(url).netloc)
+            filename = f"{safe_host}_{positions[url]+1}.{file_format}"
+            filepath = output_prefix + filename
+            future = io_pool.submit(save_data_to_file, content, filepath, file_format)
+            write_futures.append((filepath, future))
+            return future
+
+        def handle(url: str, content: Optional[str]) -> None:
+            if content:
+                write_slots.acquire()
+                submit_write(url, content).add_done_callback(
+                    lambda _: write_slots.release()
+                )
+            if on_result is not None:
+                on_result(url, bool(content))
+
+        async def drain_async() -> None:
+            # The event loop must never block on a slot, or every in-flight
+            # fetch and timeout would freeze until a disk write lands
+            loop = asyncio.get_running_loop()
+            async_slots = asyncio.Semaphore(MAX_PENDING_WRITES)
+
+            def release_slot(_future: concurrent.futures.Future) -> None:
+                try:
+                    loop.call_soon_threadsafe(async_slots.release)
+                except RuntimeError:
+                    pass  # Loop already closed; nothing is waiting for the slot
+
+            async def handle_async(url: str, content: Optional[str]) -> None:
+                if content:
+                    await async_slots.acquire()
+                    submit_write(url, content).add_done_callback(release_slot)
+                if on_result is not None:
+                    on_result(url, bool(content))
+
+            await _drain_async_results(
+                iter_scrape_results_async(urls, max_workers, parse_executor),
+                handle_async,
+                stop_event,
+            )
 
-    for i, (url, content) in enumerate(zip(urls, results)):
-        if content:
-            # Generate filename from URL
-            parsed_url = urlparse(url)
-            safe_filename = parsed_url.netloc.replace(".", "_") + f"_{i+1}"
-            filepath = os.path.join(output_dir, f"{safe_filename}.{file_format}")
+        if use_async:
+            asyncio.run(drain_async())
+        else:
+            for url, content in iter_scrape_results(urls, max_workers, parse_executor):
+                handle(url, content)
+                if stop_event is not None and stop_event.is_set():
+                    break
 
-            if save_data_to_file(content, filepath, file_format):
-                saved_files.append(filepath)
+    saved_files = [filepath for filepath, future in write_futures if future.result()]
 
-    logging.info(f"Saved {len(saved_files)} files to {output_dir}")
+    logger.info("Saved %d files to %s", len(saved_files), output_dir)
     return saved_files
@@ -27,7 +27,12 @@ def test_get_config_directory_creates_secure_dir(monkeypatch, tmp_path):
     assert config_dir.parent == tmp_path
 
 
-def test_save_template_sanitizes_name(monkeypatch, tmp_path):
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_template_sanitizes_name(monkeypatch, tmp_path, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(ui, "orjson", None)
+    elif ui.orjson is None:
+        pytest.skip("orjson not installed")
     monkeypatch.setattr(
         ui, "get_default_output_directory", lambda: str(tmp_path / "out")
     )
@@ -38,6 +43,7 @@ def test_save_template_sanitizes_name(monkeypatch, tmp_path):
     assert manager._save_template("bad*name")
     path = tmp_path / "config_templates" / "bad_name.json"
     assert path.is_file()
+    assert [p.name for p in path.parent.iterdir()] == ["bad_name.json"]
     data = json.loads(path.read_text(encoding="utf-8"))
     assert data["name"] == "bad_name"
     assert data["config"] == manager.config
@@ -54,3 +60,130 @@ def test_validate_config_rejects_invalid():
     bad["output_format"] = "pdf"
     with pytest.raises(ValueError):
         manager._validate_config(bad)
+
+
+def test_open_settings_builds_popup_once():
+    import types
+
+    manager = ui.ConfigurationManager.__new__(ui.ConfigurationManager)
+    manager.config = dict(ui.ConfigurationManager.default_config)
+    manager._settings_popup = None
+    opened = []
+    builds = []
+
+    def fake_build():
+        builds.append(1)
+        for name in ("output_format_input", "template_input", "workers_input",
+                     "timeout_input", "retry_input"):
+            setattr(manager, name, types.SimpleNamespace(text=""))
+        for name in ("auto_scroll_checkbox", "subdir_checkbox"):
+            setattr(manager, name, types.SimpleNamespace(active=None))
+        return types.SimpleNamespace(open=lambda: opened.append(1))
+
+    manager._build_settings_popup = fake_build
+    manager.open_settings()
+    manager.config["concurrent_workers"] = 7
+    manager.open_settings()
+    assert len(builds) == 1
+    assert len(opened) == 2
+    assert manager.workers_input.text == "7"
+
+
+def test_utc_timestamp_is_cached_per_second(monkeypatch):
+    monkeypatch.setattr(ui, "_utc_stamp_cache", (-1, ""))
+    monkeypatch.setattr(ui.time, "time", lambda: 0.25)
+    assert ui._utc_timestamp() == "1970-01-01T00:00:00Z"
+    monkeypatch.setattr(ui, "datetime", None)  # Same second: no formatting
+    monkeypatch.setattr(ui.time, "time", lambda: 0.75)
+    assert ui._utc_timestamp() == "1970-01-01T00:00:00Z"
+
+
+def test_get_config_directory_creates_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        ui, "get_default_output_directory", lambda: str(tmp_path / "out")
+    )
+    monkeypatch.setattr(ui.ConfigurationManager, "_ready_config_dirs", set())
+    calls = []
+    real_mkdir = ui.Path.mkdir
+
+    def counting_mkdir(self, **kwargs):
+        calls.append(self)
+        real_mkdir(self, **kwargs)
+
+    monkeypatch.setattr(ui.Path, "mkdir", counting_mkdir)
+    manager = ui.ConfigurationManager.__new__(ui.ConfigurationManager)
+    first = manager._get_config_directory()
+    assert manager._get_config_directory() == first
+    assert len(calls) == 1
+
+
+def test_default_output_directory_is_cached():
+    assert ui.get_default_output_directory() is ui.get_default_output_directory()
+    assert ui.get_default_output_directory.cache_info().hits >= 1
+
+
+def test_autosave_is_debounced_and_snapshotted(monkeypatch):
+    import types
+
+    events = []
+
+    def schedule_once(callback, delay):
+        event = types.SimpleNamespace(callback=callback, cancelled=False)
+        event.cancel = lambda: setattr(event, "cancelled", True)
+        events.append(event)
+        return event
+
+    monkeypatch.setattr(ui, "Clock", types.SimpleNamespace(schedule_once=schedule_once))
+    manager = ui.ConfigurationManager.__new__(ui.ConfigurationManager)
+    manager.config = dict(ui.ConfigurationManager.default_config)
+    manager._autosave_event = None
+    submitted = []
+    manager._autosave_pool = types.SimpleNamespace(
+        submit=lambda fn, *args: submitted.append((fn, args))
+    )
+    manager._schedule_autosave()
+    manager._schedule_autosave()
+    assert [event.cancelled for event in events] == [True, False]
+    assert submitted == []
+
+    events[-1].callback(ui.AUTOSAVE_DELAY)
+    manager.config["retry_attempts"] = 9  # Later edits do not leak into the save
+    (fn, (name, snapshot)), = submitted
+    assert name == "autosave"
+    assert snapshot["retry_attempts"] == 3
+
+
+def test_pending_autosave_is_written_when_app_stops(monkeypatch):
+    import threading
+    import types
+    from concurrent.futures import ThreadPoolExecutor
+
+    events = []
+
+    def schedule_once(callback, delay):
+        event = types.SimpleNamespace(cancelled=False)
+        event.cancel = lambda: setattr(event, "cancelled", True)
+        events.append(event)
+        return event
+
+    monkeypatch.setattr(ui, "Clock", types.SimpleNamespace(schedule_once=schedule_once))
+    manager = ui.ConfigurationManager.__new__(ui.ConfigurationManager)
+    manager.config = dict(ui.ConfigurationManager.default_config)
+    manager._autosave_event = None
+    manager._autosave_pool = ThreadPoolExecutor(max_workers=1)
+    saved = []
+    manager._save_template = lambda name, config: saved.append((name, config))
+    manager.config["retry_attempts"] = 9
+    manager._schedule_autosave()
+
+    app = ui.ModernScraperApp.__new__(ui.ModernScraperApp)
+    app.config_manager = manager
+    app.state_lock = threading.Lock()
+    app.app_state = {}
+    app._stop_event = threading.Event()
+    app._scrape_executor = ThreadPoolExecutor(max_workers=1)
+    app.on_stop()
+    assert events[0].cancelled
+    assert saved == [("autosave", manager.config)]
+    assert manager._autosave_event is None
+    manager._autosave_pool.shutdown()
@@ -2,6 +2,8 @@ import os
 import sys
 import types
 
+import pytest
+
 sys.path.insert(
     0,
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
@@ -19,32 +21,36 @@ class DummyResponse:
     def raise_for_status(self):
         pass
 
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self):
+        pass
+
 
 def test_fetch_url_uses_default_headers(monkeypatch):
     captured = {}
 
-    def mock_get(url, headers=None, timeout=None):
+    def mock_get(url, headers=None, timeout=None, stream=False):
         if headers is not None:
             captured.update(headers)
         return DummyResponse()
 
-    monkeypatch.setattr(
-        scraper,
-        "session",
-        types.SimpleNamespace(get=mock_get),
-    )
+    monkeypatch.setattr(scraper.session, "get", mock_get)
 
     result = scraper.fetch_url("http://example.com")
-    assert result == "ok"
-    assert captured["DNT"] == "1"
-    assert captured["Connection"] == "close"
+    assert result == b"ok"
+    sent = {**scraper.session.headers, **captured}
+    assert sent["DNT"] == "1"
+    assert sent["Connection"] == "keep-alive"
     assert "User-Agent" in captured
 
 
 def test_fetch_url_allows_custom_headers(monkeypatch):
     captured = {}
 
-    def mock_get(url, headers=None, timeout=None):
+    def mock_get(url, headers=None, timeout=None, stream=False):
         if headers is not None:
             captured.update(headers)
         return DummyResponse()
@@ -68,7 +74,7 @@ def test_fetch_url_uses_env_timeout(monkeypatch):
     importlib.reload(scraper)
     captured = {}
 
-    def mock_get(url, headers=None, timeout=None):
+    def mock_get(url, headers=None, timeout=None, stream=False):
         captured["timeout"] = timeout
         return DummyResponse()
 
@@ -83,3 +89,223 @@ def test_fetch_url_uses_env_timeout(monkeypatch):
 
     monkeypatch.delenv("SCRAPER_TIMEOUT", raising=False)
     importlib.reload(scraper)
+
+
+def test_fetch_url_encodes_target_url(monkeypatch):
+    captured = {}
+
+    def mock_get(url, headers=None, timeout=None, stream=False):
+        captured["url"] = url
+        return DummyResponse()
+
+    monkeypatch.setattr(scraper.session, "get", mock_get)
+
+    scraper.fetch_url("http://example.com/search?q=a&page=2#top")
+    assert captured["url"].startswith("https://api.scraperapi.com?api_key=")
+    assert captured["url"].endswith(
+        "&url=http%3A%2F%2Fexample.com%2Fsearch%3Fq%3Da%26page%3D2%23top"
+    )
+
+
+def test_fetch_url_truncates_oversized_body(monkeypatch):
+    response = DummyResponse()
+    response.content = b"x" * 100
+
+    def mock_get(url, headers=None, timeout=None, stream=False):
+        assert stream
+        return response
+
+    monkeypatch.setattr(scraper.session, "get", mock_get)
+    monkeypatch.setattr(scraper, "MAX_CONTENT_BYTES", 25)
+    monkeypatch.setattr(scraper, "STREAM_CHUNK_SIZE", 10)
+
+    assert scraper.fetch_url("http://example.com") == b"x" * 25
+
+
+def test_body_exactly_at_limit_is_not_truncated(monkeypatch):
+    monkeypatch.setattr(scraper, "MAX_CONTENT_BYTES", 20)
+    logged = []
+    monkeypatch.setattr(scraper, "log_json", lambda *args, **kw: logged.append(args))
+    buffer = scraper._BodyBuffer("http://example.com")
+    assert buffer.add(b"x" * 10) and buffer.add(b"x" * 10)
+    assert buffer.getvalue() == b"x" * 20
+    assert logged == []
+    assert not buffer.add(b"x")
+    assert buffer.getvalue() == b"x" * 20
+
+
+def test_fetch_url_serves_repeat_requests_from_disk_cache(monkeypatch, tmp_path):
+    calls = []
+
+    def mock_get(url, headers=None, timeout=None, stream=False):
+        calls.append(url)
+        return DummyResponse()
+
+    monkeypatch.setattr(scraper.session, "get", mock_get)
+    monkeypatch.setattr(scraper, "CACHE_DIR", str(tmp_path))
+
+    assert scraper.fetch_url("http://example.com/page") == b"ok"
+    assert scraper.fetch_url("http://example.com/page") == b"ok"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(scraper, "CACHE_TTL", -1)
+    assert scraper.fetch_url("http://example.com/page") == b"ok"
+    assert len(calls) == 2
+
+
+def test_session_keeps_connections_alive_in_shared_pool():
+    assert scraper.session.headers["Connection"] == "keep-alive"
+    adapter = scraper.session.get_adapter(scraper.SCRAPERAPI_URL)
+    assert adapter is scraper.session.get_adapter("http://example.com")
+    assert adapter._pool_maxsize == scraper.POOL_SIZE
+
+
+def test_fetch_url_uses_http2_client_when_enabled(monkeypatch):
+    import contextlib
+
+    class FakeHTTPError(Exception):
+        pass
+
+    class FakeStreamResponse:
+        status_code = 200
+        headers = {}
+
+        def raise_for_status(self):
+            pass
+
+        def iter_bytes(self, chunk_size):
+            yield b"o"
+            yield b"k"
+
+    captured = {}
+
+    class FakeClient:
+        @contextlib.contextmanager
+        def stream(self, method, url, headers=None, timeout=None):
+            captured.update(method=method, url=url, timeout=timeout)
+            yield FakeStreamResponse()
+
+    fake_httpx = types.SimpleNamespace(HTTPError=FakeHTTPError)
+    monkeypatch.setattr(scraper, "USE_HTTP2", True)
+    monkeypatch.setattr(scraper, "_http2_client", lambda: (fake_httpx, FakeClient()))
+    monkeypatch.setattr(
+        scraper.session, "get", lambda *a, **k: pytest.fail("requests session used")
+    )
+
+    assert scraper.fetch_url("http://example.com", timeout=3) == b"ok"
+    assert captured["method"] == "GET"
+    assert captured["url"].endswith("&url=http%3A%2F%2Fexample.com")
+    assert captured["timeout"] == 3
+
+
+def test_http2_fetch_retries_retryable_statuses_with_backoff(monkeypatch):
+    import contextlib
+
+    class FakeHTTPError(Exception):
+        pass
+
+    statuses = [503, 429, 200]
+    retry_after = {429: "7"}
+
+    class FakeStreamResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.headers = {"Retry-After": retry_after.get(status_code)}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise FakeHTTPError(str(self.status_code))
+
+        def iter_bytes(self, chunk_size):
+            yield b"ok"
+
+    class FakeClient:
+        @contextlib.contextmanager
+        def stream(self, method, url, headers=None, timeout=None):
+            yield FakeStreamResponse(statuses.pop(0))
+
+    sleeps = []
+    fake_httpx = types.SimpleNamespace(HTTPError=FakeHTTPError)
+    monkeypatch.setattr(scraper, "USE_HTTP2", True)
+    monkeypatch.setattr(scraper, "_http2_client", lambda: (fake_httpx, FakeClient()))
+    monkeypatch.setattr(scraper.time, "sleep", sleeps.append)
+    monkeypatch.setattr(scraper, "BACKOFF_FACTOR", 0.5)
+
+    assert scraper.fetch_url("http://example.com") == b"ok"
+    assert sleeps == [0.5, 7.0]
+
+    # Once the retry budget is spent, the status surfaces as a request error
+    monkeypatch.setattr(scraper, "RETRY_TOTAL", 1)
+    statuses[:] = [503, 503]
+    with pytest.raises(scraper.RequestException):
+        scraper.fetch_url("http://example.com")
+    assert statuses == [] and sleeps == [0.5, 7.0, 0.5]
+
+
+def test_http2_client_transport_retries_connects(monkeypatch):
+    created = {}
+
+    def fake_transport(**kwargs):
+        created.update(kwargs)
+        return "transport"
+
+    fake_httpx = types.SimpleNamespace(
+        Client=lambda **kwargs: kwargs,
+        HTTPTransport=fake_transport,
+        Limits=lambda **kwargs: kwargs,
+    )
+    monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
+    _httpx, client = scraper._http2_client.__wrapped__()
+    assert client["transport"] == "transport"
+    assert created["http2"] and created["retries"] == scraper.RETRY_TOTAL
+
+
+def test_configure_session_resizes_shared_pool():
+    original = scraper.POOL_SIZE
+    try:
+        scraper.configure_session(80)
+        adapter = scraper.session.get_adapter(scraper.SCRAPERAPI_URL)
+        assert adapter._pool_maxsize == 80
+        assert adapter is scraper.session.get_adapter("http://example.com")
+        assert scraper.POOL_SIZE == 80
+    finally:
+        scraper.configure_session(original)
+
+
+def test_fetch_url_spaces_requests_per_host(monkeypatch):
+    now = [100.0]
+    slept = []
+    monkeypatch.setattr(scraper, "HOST_MIN_INTERVAL", 1.0)
+    monkeypatch.setattr(scraper, "_host_next_slot", {})
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(scraper.time, "sleep", slept.append)
+    monkeypatch.setattr(scraper.session, "get", lambda *a, **kw: DummyResponse())
+
+    scraper.fetch_url("http://a.example.com/1")
+    scraper.fetch_url("http://b.example.com/1")  # Other host: no wait
+    now[0] += 0.25
+    scraper.fetch_url("http://a.example.com/2")
+    scraper.fetch_url("http://a.example.com/3")
+    assert slept == [0.75, 1.75]
+
+
+@pytest.mark.parametrize("content", [b"", b"x" * 100])
+def test_fetch_url_does_not_cache_empty_or_truncated_bodies(
+    monkeypatch, tmp_path, content
+):
+    calls = []
+    response = DummyResponse()
+    response.content = content
+
+    def mock_get(url, headers=None, timeout=None, stream=False):
+        calls.append(url)
+        return response
+
+    monkeypatch.setattr(scraper.session, "get", mock_get)
+    monkeypatch.setattr(scraper, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "MAX_CONTENT_BYTES", 25)
+
+    scraper.fetch_url("http://example.com/flaky")
+    scraper.fetch_url("http://example.com/flaky")
+    assert len(calls) == 2
+    assert not any(tmp_path.iterdir())
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+
 os.environ.setdefault("KIVY_WINDOW", "mock")
 os.environ.setdefault("KIVY_NO_ARGS", "1")
 os.environ.setdefault("SCRAPER_API_KEY", "test")
@@ -27,3 +29,303 @@ def test_state_thread_safety():
     with app.state_lock:
         app.app_state["value"] = 42
     assert app.app_state["value"] == 42
+
+
+def _make_url_input(text, monkeypatch, checked):
+    import logging
+    import types
+    import ui
+
+    def fake_validate(url):
+        checked.append(url)
+        return "bad" not in url
+
+    monkeypatch.setattr(ui, "validate_url", fake_validate)
+    widget = EnhancedURLInput.__new__(EnhancedURLInput)
+    widget.text_input = types.SimpleNamespace(text=text)
+    widget.status_label = types.SimpleNamespace(text="")
+    widget._valid_cache = {}
+    widget._validated_text = None
+    widget._requested_text = None
+    widget._validation_generation = 0
+    widget._validation_event = None
+    widget._last_edit_time = 0.0
+    widget.logger = logging.getLogger("test")
+    # Run "background" validation inline and skip the main-thread hop
+    widget._validation_pool = types.SimpleNamespace(
+        submit=lambda fn, *args: fn(*args)
+    )
+    widget._deliver_validation = widget._apply_validation
+    return widget
+
+
+def test_validate_urls_prefilters_and_caches(monkeypatch):
+    checked = []
+    widget = _make_url_input(
+        "https://a.example, ftp://x.example\nhttps://bad.example\n" + "http://" + "a" * 3000,
+        monkeypatch,
+        checked,
+    )
+    widget._validate_urls()
+    assert widget.valid_urls == ["https://a.example"]
+    assert len(widget.invalid_urls) == 3
+    assert checked == ["https://a.example", "https://bad.example"]
+
+    widget.text_input.text += "\nhttps://b.example"
+    widget._validate_urls()
+    assert widget.valid_urls == ["https://a.example", "https://b.example"]
+    assert checked == ["https://a.example", "https://bad.example", "https://b.example"]
+    assert widget.status_label.text == "2 valid / 3 invalid"
+
+
+def test_validate_urls_skips_unchanged_text(monkeypatch):
+    checked = []
+    widget = _make_url_input("https://a.example", monkeypatch, checked)
+    widget._validate_urls()
+    widget._valid_cache = {}
+    widget._validate_urls()
+    assert checked == ["https://a.example"]
+    assert widget.valid_urls == ["https://a.example"]
+
+
+def test_text_change_validates_on_leading_edge_then_debounces(monkeypatch):
+    import types
+    import ui
+
+    scheduled = []
+    clock = types.SimpleNamespace(
+        schedule_once=lambda callback, delay: scheduled.append(delay)
+        or types.SimpleNamespace(cancel=lambda: None)
+    )
+    now = [100.0]
+    monkeypatch.setattr(ui, "Clock", clock)
+    monkeypatch.setattr(ui.time, "monotonic", lambda: now[0])
+
+    checked = []
+    widget = _make_url_input("https://a.example", monkeypatch, checked)
+    widget._on_text_change()
+    assert checked == ["https://a.example"]
+
+    now[0] += 0.2
+    widget.text_input.text = "https://a.example\nhttps://b.example" + " " * 40000
+    widget._on_text_change()
+    assert checked == ["https://a.example"]
+    assert scheduled[0] < scheduled[1] == ui.VALIDATION_MAX_DELAY
+
+
+def test_background_validation_drops_stale_results(monkeypatch):
+    checked = []
+    widget = _make_url_input("https://a.example", monkeypatch, checked)
+    pending = []
+    widget._validation_pool = type(
+        "_Pool", (), {"submit": lambda self, fn, *args: pending.append((fn, args))}
+    )()
+
+    widget._validate_in_background()
+    widget.text_input.text = "https://b.example"
+    widget._validate_in_background()
+    for fn, args in reversed(pending):  # Newer request finishes first
+        fn(*args)
+    assert widget.valid_urls == ["https://b.example"]
+
+
+def test_load_file_appends_with_single_text_update(monkeypatch, tmp_path):
+    checked = []
+    widget = _make_url_input("https://a.example", monkeypatch, checked)
+    updates = []
+
+    class _Text:
+        def __init__(self, text):
+            self._text = text
+
+        @property
+        def text(self):
+            return self._text
+
+        @text.setter
+        def text(self, value):
+            updates.append(value)
+            self._text = value
+
+    widget.text_input = _Text("https://a.example")
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://b.example\nhttps://c.example", encoding="utf-8")
+    widget._load_file(str(url_file))
+    assert updates == ["https://a.example\nhttps://b.example\nhttps://c.example"]
+
+
+def _make_app(widget):
+    import threading
+    import types
+    from concurrent.futures import Future
+
+    app = ModernScraperApp.__new__(ModernScraperApp)
+    app.url_input = widget
+    app.state_lock = threading.Lock()
+    app.app_state = {}
+    app.config_manager = types.SimpleNamespace(
+        config=dict(ConfigurationManager.default_config)
+    )
+    app.added = []
+    app.progress_tracker = types.SimpleNamespace(add_urls=app.added.extend)
+    app.jobs = []
+    # Jobs stay pending until the test resolves them
+    app._scrape_executor = types.SimpleNamespace(
+        submit=lambda fn, *args, **kwargs: app.jobs.append((fn, args, kwargs))
+        or Future()
+    )
+    app._scrape_future = None
+    app._stop_event = threading.Event()
+    return app
+
+
+def test_start_scraping_reuses_validated_urls(monkeypatch):
+    checked = []
+    widget = _make_url_input("https://a.example\nhttps://bad.example", monkeypatch, checked)
+    widget._validate_urls()
+    app = _make_app(widget)
+    app.start_scraping()
+    assert app.added == ["https://a.example"]
+    assert checked == ["https://a.example", "https://bad.example"]
+
+
+def test_start_scraping_drops_duplicate_urls(monkeypatch):
+    checked = []
+    widget = _make_url_input(
+        "https://a.example\nhttps://b.example, https://a.example", monkeypatch, checked
+    )
+    app = _make_app(widget)
+    app.start_scraping()
+    assert app.added == ["https://a.example", "https://b.example"]
+    assert app.jobs[0][1][0] == ["https://a.example", "https://b.example"]
+
+
+def test_start_scraping_runs_one_job_at_a_time(monkeypatch):
+    import ui
+
+    checked = []
+    widget = _make_url_input("https://a.example", monkeypatch, checked)
+    app = _make_app(widget)
+    app.start_scraping()
+    app.start_scraping()  # Ignored while the first job is in flight
+    (fn, (urls, _output_dir, file_format, workers), kwargs), = app.jobs
+    assert fn is ui.scrape_urls_to_files
+    assert (urls, file_format, workers) == (["https://a.example"], "txt", 3)
+    assert kwargs["use_async"] and kwargs["stop_event"] is app._stop_event
+    assert app.app_state["is_scraping"]
+    app.stop_scraping()
+    assert app._stop_event.is_set()
+
+    app._scrape_future.set_result(["a.txt"])
+    ModernScraperApp._finish_scraping.__wrapped__(app, app._scrape_future)
+    assert not app.app_state["is_scraping"]
+    app.start_scraping()
+    assert len(app.jobs) == 2
+    assert not app._stop_event.is_set()
+
+
+def test_load_file_rejects_directories_and_large_files(monkeypatch, tmp_path):
+    checked = []
+    widget = _make_url_input("", monkeypatch, checked)
+    big = tmp_path / "big.txt"
+    big.write_text("x" * 1_000_001, encoding="utf-8")
+    for path in (tmp_path, big):
+        widget._load_file(str(path))
+        assert widget.text_input.text == ""
+        assert widget.status_label.text == "File load failed"
+
+
+def test_validate_urls_splits_on_commas_and_whitespace(monkeypatch):
+    checked = []
+    widget = _make_url_input(
+        " https://a.example,,https://b.example\t\n\n https://c.example , ",
+        monkeypatch,
+        checked,
+    )
+    widget._validate_urls()
+    assert widget.valid_urls == [
+        "https://a.example",
+        "https://b.example",
+        "https://c.example",
+    ]
+    assert widget.invalid_urls == []
+
+
+def test_underscore_stuffed_hosts_are_rejected_before_validation(monkeypatch):
+    checked = []
+    widget = _make_url_input(
+        "http://a____b.example\nhttps://" + "a_" * 21 + ".example\n"
+        "https://a_b.example/____",
+        monkeypatch,
+        checked,
+    )
+    widget._validate_urls()
+    assert widget.valid_urls == ["https://a_b.example/____"]
+    assert checked == ["https://a_b.example/____"]
+
+
+def test_file_chooser_popup_is_built_once(monkeypatch):
+    import types
+
+    widget = _make_url_input("", monkeypatch, [])
+    widget._file_popup = None
+    builds = []
+    opened = []
+    relisted = []
+
+    def fake_build():
+        builds.append(1)
+        filters = types.SimpleNamespace(
+            dispatch=lambda chooser: relisted.append(chooser)
+        )
+        widget._file_chooser = types.SimpleNamespace(
+            selection=["old"], property=lambda name: {"filters": filters}[name]
+        )
+        return types.SimpleNamespace(open=lambda: opened.append(1))
+
+    widget._build_file_popup = fake_build
+    widget._open_file_chooser(None)
+    widget._open_file_chooser(None)
+    assert (len(builds), len(opened)) == (1, 2)
+    assert relisted == [widget._file_chooser]
+    assert widget._file_chooser.selection == []
+
+
+def test_load_file_closes_descriptor_on_failure(monkeypatch, tmp_path):
+    import ui
+
+    widget = _make_url_input("", monkeypatch, [])
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://a.example", encoding="utf-8")
+    opened = []
+    real_open = os.open
+
+    def recording_open(*args):
+        opened.append(real_open(*args))
+        return opened[-1]
+
+    def failing_fdopen(*args, **kwargs):
+        raise OSError("fdopen failed")
+
+    monkeypatch.setattr(ui.os, "open", recording_open)
+    monkeypatch.setattr(ui.os, "fdopen", failing_fdopen)
+    for path in (tmp_path, url_file):  # Rejected by fstat, then by fdopen
+        widget._load_file(str(path))
+        assert widget.status_label.text == "File load failed"
+    monkeypatch.undo()
+    for fd in opened:
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
+def test_on_stop_stops_running_scrape(monkeypatch):
+    widget = _make_url_input("https://a.example", monkeypatch, [])
+    app = _make_app(widget)
+    shutdowns = []
+    app._scrape_executor.shutdown = lambda **kwargs: shutdowns.append(kwargs)
+    app.config_manager.flush_autosave = lambda: shutdowns.append("flushed")
+    app.start_scraping()
+    app.on_stop()
+    assert app._stop_event.is_set()
+    assert not app.app_state["is_scraping"]
+    assert shutdowns == [{"wait": False, "cancel_futures": True}, "flushed"]
@@ -0,0 +1,120 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+os.environ.setdefault("SCRAPER_API_KEY", "test")
+
+import scraper  # noqa: E402
+
+SAMPLE_HTML = """
+<html><head><title>My Page</title><style>.a {}</style></head><body>
+<nav>navigation links here</nav>
+<article>
+  <h2>Section heading here</h2>
+  <p>First paragraph with text. <a href="#">link text</a></p>
+  <pre>code block content here</pre>
+  <blockquote>a quoted sentence here</blockquote>
+  <ul><li>list item number one</li></ul>
+  <div><span>span text inside a div</span><script>var x = 1;</script></div>
+</article>
+</body></html>
+"""
+
+
+def test_parse_html_formats_elements():
+    result = scraper._parse_html(SAMPLE_HTML, "http://example.com")
+    assert result.startswith("Title: My Page")
+    assert "## Section heading here" in result
+    assert "> a quoted sentence here" in result
+    assert "navigation links here" not in result
+    assert "var x" not in result
+
+
+def test_parse_html_falls_back_to_body_text():
+    result = scraper._parse_html("<p>short</p>", "http://example.com")
+    assert result == "Title: No title found\n\nshort"
+
+
+def test_selectolax_matches_bs4():
+    pytest.importorskip("selectolax")
+    assert scraper._extract_with_selectolax(
+        SAMPLE_HTML
+    ) == scraper._extract_with_bs4(SAMPLE_HTML)
+
+
+def test_extractors_collapse_whitespace_like_bs4():
+    html = (
+        "<article><div> <p> first part</p> <p></p> <p>second </p>"
+        "x<b>y</b> z</div></article>"
+    )
+    expected = ("No title found", ["first part second x y z"], "")
+    assert scraper._extract_with_bs4(html) == expected
+    if scraper.LexborHTMLParser is not None:
+        assert scraper._extract_with_selectolax(html) == expected
+    if scraper.HTML_PARSER == "lxml":
+        assert scraper._extract_with_lxml(html) == expected
+
+
+def test_lxml_matches_bs4():
+    pytest.importorskip("lxml")
+    assert scraper._extract_with_lxml(SAMPLE_HTML) == scraper._extract_with_bs4(
+        SAMPLE_HTML
+    )
+    assert scraper._extract_with_lxml(
+        "<p>short</p>"
+    ) == scraper._extract_with_bs4("<p>short</p>")
+
+
+LATIN1_PAGE = (
+    '<html><head><meta charset="iso-8859-1"><title>Caf\xe9</title></head>'
+    "<body><p>Un caf\xe9 au lait, merci</p></body></html>"
+).encode("latin-1")
+
+
+def test_parse_html_honours_meta_charset_for_bytes():
+    result = scraper._parse_html(LATIN1_PAGE, "http://example.com")
+    assert result == "Title: Caf\xe9\n\nUn caf\xe9 au lait, merci"
+
+
+def test_lxml_honours_meta_charset_for_bytes(monkeypatch):
+    pytest.importorskip("lxml")
+    monkeypatch.setattr(scraper, "LexborHTMLParser", None)
+    result = scraper._parse_html(LATIN1_PAGE, "http://example.com")
+    assert result == "Title: Caf\xe9\n\nUn caf\xe9 au lait, merci"
+
+
+@pytest.mark.parametrize(
+    "extract",
+    [
+        scraper._extract_with_bs4,
+        pytest.param(
+            scraper._extract_with_selectolax,
+            marks=pytest.mark.skipif(
+                scraper.LexborHTMLParser is None, reason="selectolax not installed"
+            ),
+        ),
+        pytest.param(
+            scraper._extract_with_lxml,
+            marks=pytest.mark.skipif(
+                scraper.HTML_PARSER != "lxml", reason="lxml not installed"
+            ),
+        ),
+    ],
+)
+def test_main_content_prefers_article_over_earlier_content_class(extract):
+    html = (
+        "<html><body>"
+        "<div class='sidebar content'><p>Sidebar paragraph text here</p></div>"
+        "<article><p>Article paragraph text here</p></article>"
+        "</body></html>"
+    )
+    _, content, _ = extract(html)
+    assert content == ["Article paragraph text here"]
+
+
+def test_bs4_fallback_uses_lxml_when_installed():
+    pytest.importorskip("lxml")
+    assert scraper.HTML_PARSER == "lxml"
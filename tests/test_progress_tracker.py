@@ -0,0 +1,151 @@
+import os
+import sys
+
+os.environ.setdefault("KIVY_WINDOW", "mock")
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("SCRAPER_API_KEY", "test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import progress_tracker  # noqa: E402
+from progress_tracker import ScrapingProgressTracker  # noqa: E402
+
+
+class _FakeWidget:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def add_widget(self, _widget):
+        pass
+
+
+def _init_update_queue(tracker):
+    import threading
+
+    tracker._pending_updates = []
+    tracker._pending_log = []
+    tracker._log_lines = progress_tracker.deque()
+    tracker.auto_scroll = False
+    tracker._pending_lock = threading.Lock()
+    tracker._flush_scheduled = False
+
+
+def test_add_urls_registers_batch_with_one_redraw(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        progress_tracker.Clock,
+        "schedule_once",
+        lambda callback, delay=0: scheduled.append(callback),
+    )
+    monkeypatch.setattr(progress_tracker, "BoxLayout", _FakeWidget)
+    monkeypatch.setattr(progress_tracker, "Label", _FakeWidget)
+    tracker = ScrapingProgressTracker.__new__(ScrapingProgressTracker)
+    tracker.add_widget = lambda _widget: None
+    tracker.url_widgets = {}
+    tracker.total_urls = 0
+    tracker._display_update_pending = False
+    tracker._finished_rows = progress_tracker.deque()
+    # Call through the @mainthread wrapper so the batch runs inline
+    ScrapingProgressTracker.add_urls.__wrapped__(
+        tracker, ["https://a.example", "https://b.example", "https://a.example"]
+    )
+    assert list(tracker.url_widgets) == ["https://a.example", "https://b.example"]
+    assert tracker.total_urls == 2
+    assert scheduled == [tracker._flush_overall_display]
+
+
+def test_finished_rows_beyond_limit_are_detached(monkeypatch):
+    monkeypatch.setattr(progress_tracker, "FINISHED_ROWS_KEPT", 2)
+    monkeypatch.setattr(progress_tracker.Clock, "schedule_once", lambda *a: None)
+    monkeypatch.setattr(progress_tracker, "BoxLayout", _FakeWidget)
+    monkeypatch.setattr(progress_tracker, "Label", _FakeWidget)
+    tracker = ScrapingProgressTracker.__new__(ScrapingProgressTracker)
+    rows = []
+    tracker.add_widget = rows.append
+    tracker.remove_widget = rows.remove
+    tracker.url_widgets = {}
+    tracker.total_urls = 0
+    tracker.completed_urls = 0
+    tracker._display_update_pending = False
+    tracker._finished_rows = progress_tracker.deque()
+    tracker._completion_times = progress_tracker.deque([0.0])
+    _init_update_queue(tracker)
+    urls = [f"https://{name}.example" for name in "abc"]
+    ScrapingProgressTracker.add_urls.__wrapped__(tracker, urls)
+    for url in urls:
+        tracker.update_url_progress(url, "completed")
+    tracker._flush_pending_updates(0)
+    assert rows == [tracker.url_widgets[url].layout for url in urls[1:]]
+    assert tracker.completed_urls == 3
+
+
+def test_progress_updates_are_coalesced_into_one_callback(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        progress_tracker.Clock,
+        "schedule_once",
+        lambda callback, delay=0: scheduled.append(callback),
+    )
+    tracker = ScrapingProgressTracker.__new__(ScrapingProgressTracker)
+    _init_update_queue(tracker)
+    applied = []
+    tracker._apply_url_progress = lambda *update: applied.append(update)
+    tracker.update_url_progress("https://a.example", "fetching")
+    tracker.update_url_progress("https://a.example", "completed", data_size=10)
+    assert scheduled == [tracker._flush_pending_updates]
+    tracker._flush_pending_updates(0)
+    assert applied == [
+        ("https://a.example", "fetching", "", None),
+        ("https://a.example", "completed", "", 10),
+    ]
+    tracker.update_url_progress("https://b.example", "failed")
+    assert len(scheduled) == 2
+
+
+def test_log_view_keeps_a_bounded_tail(monkeypatch):
+    monkeypatch.setattr(progress_tracker.Clock, "schedule_once", lambda *a: None)
+    stamps = []
+    monkeypatch.setattr(
+        progress_tracker, "strftime", lambda fmt: stamps.append(fmt) or "12:00:00"
+    )
+    tracker = ScrapingProgressTracker.__new__(ScrapingProgressTracker)
+    _init_update_queue(tracker)
+    tracker._log_lines = progress_tracker.deque(maxlen=2)
+    tracker.auto_scroll = True
+    writes = []
+
+    class _Log:
+        def __setattr__(self, name, value):
+            writes.append((name, value))
+
+    tracker.log_output = _Log()
+    tracker.log_message("completed: https://a.example")
+    tracker.log_message("failed: https://b.example\r")
+    tracker.log_message("completed: https://c.example")
+    tracker._flush_pending_updates(0)
+    # One text update per flush, holding only the newest lines
+    assert writes == [
+        (
+            "text",
+            "[12:00:00] failed: https://b.example\n"
+            "[12:00:00] completed: https://c.example",
+        ),
+        ("cursor", (0, 1)),
+    ]
+    assert stamps == ["%H:%M:%S"]
+
+
+def test_speed_stays_near_true_rate_for_batched_completions(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(progress_tracker, "perf_counter", lambda: now[0])
+    tracker = ScrapingProgressTracker.__new__(ScrapingProgressTracker)
+    tracker._completion_times = progress_tracker.deque(
+        [0.0], maxlen=progress_tracker.SPEED_WINDOW + 1
+    )
+    # 60 URL/min, delivered as bursts of ten completions every ten seconds
+    for _burst in range(20):
+        now[0] += 10.0
+        for _ in range(10):
+            tracker._record_completion()
+            now[0] += 0.001
+        assert 50 < tracker.speed < 70
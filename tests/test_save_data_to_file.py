@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+os.environ.setdefault("SCRAPER_API_KEY", "test")
+
+import scraper  # noqa: E402
+
+
+def test_save_data_to_file_creates_missing_directory(tmp_path):
+    target = tmp_path / "nested" / "page.txt"
+    assert scraper.save_data_to_file("café\nline two", str(target))
+    assert target.read_bytes() == "café\nline two".encode("utf-8")
+
+
+def test_save_data_to_file_replaces_existing_content(tmp_path):
+    target = tmp_path / "page.md"
+    target.write_text("a much longer previous body")
+    assert scraper.save_data_to_file("new", str(tmp_path / "page"), "md")
+    assert target.read_text() == "new"
+
+
+def test_save_data_to_file_rejects_empty_data(tmp_path):
+    assert not scraper.save_data_to_file("", str(tmp_path / "page.txt"))
+    assert not (tmp_path / "page.txt").exists()
+
+
+def test_save_data_to_file_leaves_permissions_to_umask(tmp_path):
+    import stat
+
+    old_umask = os.umask(0o022)
+    try:
+        assert scraper.save_data_to_file("data", str(tmp_path / "page.txt"))
+    finally:
+        os.umask(old_umask)
+    mode = stat.S_IMODE(os.stat(tmp_path / "page.txt").st_mode)
+    assert mode == 0o644
@@ -1,6 +1,10 @@
+import asyncio
+import concurrent.futures
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 os.environ.setdefault("SCRAPER_API_KEY", "test")
@@ -11,7 +15,7 @@ import scraper  # noqa: E402
 def test_scrape_multiple_urls_skips_invalid(monkeypatch):
     called = []
 
-    def fake_scrape_text_data(url):
+    def fake_scrape_text_data(url, **kwargs):
         called.append(url)
         return f"data for {url}"
 
@@ -20,3 +24,421 @@ def test_scrape_multiple_urls_skips_invalid(monkeypatch):
     results = scraper.scrape_multiple_urls(urls, max_workers=1)
     assert called == ["http://example.com"]
     assert len(results) == 1
+
+
+def test_scrape_multiple_urls_async_parses_pages(monkeypatch):
+    pytest.importorskip("aiohttp")
+    fetched = []
+
+    async def fake_get_page_content_async(client, url, **kwargs):
+        fetched.append(url)
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "get_page_content_async", fake_get_page_content_async)
+    urls = ["http://example.com", "http://localhost"]
+    results = asyncio.run(scraper.scrape_multiple_urls_async(urls, concurrency=2))
+    assert fetched == ["http://example.com"]
+    assert results == ["Title: T\n\nSome paragraph text"]
+
+
+def test_scrape_multiple_urls_can_run_on_event_loop(monkeypatch):
+    pytest.importorskip("aiohttp")
+
+    async def fake_get_page_content_async(client, url, **kwargs):
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    def fail_scrape_text_data(url, **kwargs):
+        raise AssertionError("thread pool path used")
+
+    monkeypatch.setattr(scraper, "get_page_content_async", fake_get_page_content_async)
+    monkeypatch.setattr(scraper, "scrape_text_data", fail_scrape_text_data)
+    results = scraper.scrape_multiple_urls(
+        ["http://example.com"], max_workers=10, use_async=True
+    )
+    assert results == ["Title: T\n\nSome paragraph text"]
+
+
+def test_scrape_urls_to_files_names_by_input_position(monkeypatch, tmp_path):
+    def fake_scrape_text_data(url, **kwargs):
+        return None if "fail" in url else f"data for {url}"
+
+    monkeypatch.setattr(scraper, "scrape_text_data", fake_scrape_text_data)
+    urls = ["http://fail.example.com", "http://localhost", "http://example.com"]
+    saved = scraper.scrape_urls_to_files(urls, output_dir=str(tmp_path), max_workers=1)
+    assert saved == [str(tmp_path / "example_com_3.txt")]
+    assert (tmp_path / "example_com_3.txt").read_text() == "data for http://example.com"
+
+
+def test_scrape_multiple_urls_parses_in_process_pool(monkeypatch):
+    def fake_get_page_content(url, **kwargs):
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "get_page_content", fake_get_page_content)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as parse_executor:
+        results = scraper.scrape_multiple_urls(
+            ["http://example.com", "http://localhost"],
+            max_workers=1,
+            parse_executor=parse_executor,
+        )
+    assert results == ["Title: T\n\nSome paragraph text"]
+
+
+def test_iter_scrape_results_caps_workers_at_pool_size(monkeypatch):
+    created = {}
+    real_executor = concurrent.futures.ThreadPoolExecutor
+
+    def recording_executor(max_workers=None, **kwargs):
+        created["max_workers"] = max_workers
+        return real_executor(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(scraper, "scrape_text_data", lambda url, **kwargs: "data")
+    monkeypatch.setattr(scraper, "POOL_SIZE", 2)
+    monkeypatch.setattr(
+        scraper.concurrent.futures, "ThreadPoolExecutor", recording_executor
+    )
+
+    results = list(scraper.iter_scrape_results(["http://example.com"], max_workers=10))
+    assert results == [("http://example.com", "data")]
+    assert created["max_workers"] == 2
+
+
+def test_scrape_multiple_urls_validates_each_url_once(monkeypatch):
+    checked = []
+    real_validate = scraper.validate_url
+
+    def counting_validate(url):
+        checked.append(url)
+        return real_validate(url)
+
+    def fake_fetch_url(url, timeout=None, headers=None, *, _validate=True, **kwargs):
+        assert not _validate
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "validate_url", counting_validate)
+    monkeypatch.setattr(scraper, "fetch_url", fake_fetch_url)
+    results = scraper.scrape_multiple_urls(["http://example.com"], max_workers=1)
+    assert results == ["Title: T\n\nSome paragraph text"]
+    assert checked == ["http://example.com"]
+
+
+def test_scrape_urls_to_files_parses_in_process_pool(monkeypatch, tmp_path):
+    def fake_get_page_content(url, **kwargs):
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "get_page_content", fake_get_page_content)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as parse_executor:
+        saved = scraper.scrape_urls_to_files(
+            ["http://example.com"],
+            output_dir=str(tmp_path),
+            max_workers=1,
+            parse_executor=parse_executor,
+        )
+    assert saved == [str(tmp_path / "example_com_1.txt")]
+    assert (tmp_path / "example_com_1.txt").read_text() == (
+        "Title: T\n\nSome paragraph text"
+    )
+
+
+def test_scrape_urls_to_files_sanitizes_host_in_filename(monkeypatch, tmp_path):
+    monkeypatch.setattr(scraper, "scrape_text_data", lambda url, **kwargs: "data")
+    saved = scraper.scrape_urls_to_files(
+        ["http://example.com:443/a"], output_dir=str(tmp_path), max_workers=1
+    )
+    assert saved == [str(tmp_path / "example_com_443_1.txt")]
+
+
+def test_scrape_urls_to_files_async_reports_and_stops(monkeypatch, tmp_path):
+    pytest.importorskip("aiohttp")
+    import threading
+
+    stop_event = threading.Event()
+    fetched = []
+
+    async def fake_get_page_content_async(client, url, **kwargs):
+        fetched.append(url)
+        if "slow" in url:
+            await asyncio.sleep(60)  # Cancelled once the run is stopped
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    reported = []
+
+    def on_result(url, ok):
+        reported.append((url, ok))
+        stop_event.set()
+
+    monkeypatch.setattr(scraper, "get_page_content_async", fake_get_page_content_async)
+    saved = scraper.scrape_urls_to_files(
+        ["http://slow.example.com", "http://example.com"],
+        output_dir=str(tmp_path),
+        max_workers=2,
+        use_async=True,
+        on_result=on_result,
+        stop_event=stop_event,
+    )
+    assert reported == [("http://example.com", True)]
+    assert saved == [str(tmp_path / "example_com_2.txt")]
+    assert sorted(fetched) == ["http://example.com", "http://slow.example.com"]
+
+
+def test_scrape_urls_to_files_stop_cancels_queued_fetches(monkeypatch, tmp_path):
+    import threading
+
+    stop_event = threading.Event()
+    release = threading.Event()
+    called = []
+
+    def fake_scrape_text_data(url, **kwargs):
+        called.append(url)
+        if url != "http://a.example.com":
+            release.wait(5)
+        return f"data for {url}"
+
+    def on_result(url, ok):
+        stop_event.set()
+        # Let the fetch already in flight finish after the stop is handled
+        threading.Timer(0.2, release.set).start()
+
+    monkeypatch.setattr(scraper, "scrape_text_data", fake_scrape_text_data)
+    urls = [f"http://{name}.example.com" for name in "abcd"]
+    saved = scraper.scrape_urls_to_files(
+        urls,
+        output_dir=str(tmp_path),
+        max_workers=1,
+        on_result=on_result,
+        stop_event=stop_event,
+    )
+    assert saved == [str(tmp_path / "a_example_com_1.txt")]
+    # Only the fetch that may already have been running when the stop landed
+    assert called in (urls[:1], urls[:2])
+
+
+def test_scrape_urls_to_files_bounds_pending_writes(monkeypatch, tmp_path):
+    import threading
+    import time
+
+    lock = threading.Lock()
+    pending = [0]
+    peak = [0]
+    real_submit = concurrent.futures.ThreadPoolExecutor.submit
+
+    def counting_submit(self, fn, *args, **kwargs):
+        if fn is not scraper.save_data_to_file:
+            return real_submit(self, fn, *args, **kwargs)
+        with lock:
+            pending[0] += 1
+            peak[0] = max(peak[0], pending[0])
+
+        def slow_save(*save_args):
+            time.sleep(0.01)
+            result = fn(*save_args)
+            with lock:
+                pending[0] -= 1
+            return result
+
+        return real_submit(self, slow_save, *args)
+
+    monkeypatch.setattr(scraper, "MAX_PENDING_WRITES", 1)
+    monkeypatch.setattr(scraper, "scrape_text_data", lambda url, **kw: f"data {url}")
+    monkeypatch.setattr(concurrent.futures.ThreadPoolExecutor, "submit", counting_submit)
+    urls = [f"http://{name}.example.com" for name in "abcd"]
+    saved = scraper.scrape_urls_to_files(urls, output_dir=str(tmp_path), max_workers=2)
+    assert len(saved) == 4
+    assert peak[0] == 1
+
+
+def test_scrape_urls_to_files_async_waits_for_write_slots_without_blocking(
+    monkeypatch, tmp_path
+):
+    pytest.importorskip("aiohttp")
+    import threading
+
+    release = threading.Event()
+    waits = []
+    real_save = scraper.save_data_to_file
+
+    def blocking_save(*args):
+        waits.append(release.wait(5))
+        return real_save(*args)
+
+    async def fake_get_page_content_async(client, url, **kwargs):
+        if "late" in url:
+            # Only runs if the loop is not stuck waiting for a write slot
+            await asyncio.sleep(0.05)
+            release.set()
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "MAX_PENDING_WRITES", 1)
+    monkeypatch.setattr(scraper, "save_data_to_file", blocking_save)
+    monkeypatch.setattr(scraper, "get_page_content_async", fake_get_page_content_async)
+    urls = ["http://a.example.com", "http://b.example.com", "http://late.example.com"]
+    saved = scraper.scrape_urls_to_files(
+        urls, output_dir=str(tmp_path), max_workers=3, use_async=True
+    )
+    assert len(saved) == 3
+    assert waits == [True, True, True]
+
+
+def test_scrape_urls_to_files_scrapes_repeated_urls_once(monkeypatch, tmp_path):
+    called = []
+
+    def fake_scrape_text_data(url, **kwargs):
+        called.append(url)
+        return f"data for {url}"
+
+    monkeypatch.setattr(scraper, "scrape_text_data", fake_scrape_text_data)
+    urls = ["http://a.example.com", "http://b.example.com", "http://a.example.com"]
+    saved = scraper.scrape_urls_to_files(urls, output_dir=str(tmp_path), max_workers=2)
+    assert sorted(called) == urls[:2]
+    assert sorted(saved) == [
+        str(tmp_path / "a_example_com_1.txt"),
+        str(tmp_path / "b_example_com_2.txt"),
+    ]
+
+
+def test_iter_scrape_results_async_awaits_cancelled_tasks_on_close(monkeypatch):
+    pytest.importorskip("aiohttp")
+    unwound = []
+
+    async def fake_get_page_content_async(client, url, **kwargs):
+        if "slow" in url:
+            try:
+                await asyncio.sleep(60)
+            finally:
+                await asyncio.sleep(0)  # Cleanup that needs the loop
+                unwound.append(url)
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "get_page_content_async", fake_get_page_content_async)
+
+    async def first_then_close():
+        results = scraper.iter_scrape_results_async(
+            ["http://slow.example.com", "http://example.com"], concurrency=2
+        )
+        first = await results.__anext__()
+        await results.aclose()
+        # Checked before asyncio.run's own shutdown could reap the task
+        return first, list(unwound)
+
+    first, unwound_on_close = asyncio.run(first_then_close())
+    assert first[0] == "http://example.com"
+    assert unwound_on_close == ["http://slow.example.com"]
+
+
+def test_iter_scrape_results_async_validates_off_the_event_loop(monkeypatch):
+    pytest.importorskip("aiohttp")
+    import threading
+
+    validated_on = []
+    real_validate = scraper.validate_url
+    fetched = []
+
+    def recording_validate(url):
+        validated_on.append(threading.current_thread())
+        return real_validate(url)
+
+    async def fake_get_page_content_async(client, url, **kwargs):
+        fetched.append((url, kwargs.get("_validate")))
+        return b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+    monkeypatch.setattr(scraper, "validate_url", recording_validate)
+    monkeypatch.setattr(scraper, "get_page_content_async", fake_get_page_content_async)
+
+    async def collect():
+        results = scraper.iter_scrape_results_async(
+            ["http://example.com", "http://localhost"], concurrency=2
+        )
+        return [url async for url, _content in results]
+
+    assert asyncio.run(collect()) == ["http://example.com"]
+    assert fetched == [("http://example.com", False)]
+    assert len(validated_on) == 2
+    assert threading.main_thread() not in validated_on
+
+
+HTML = b"<html><title>T</title><body><p>Some paragraph text</p></body></html>"
+
+
+def test_iter_scrape_results_busy_host_does_not_delay_other_hosts(monkeypatch):
+    fetched = {}
+    start = scraper.time.monotonic()
+
+    def fake_fetch_url(url, timeout=None, headers=None, **kwargs):
+        fetched[url] = scraper.time.monotonic() - start
+        return HTML
+
+    monkeypatch.setattr(scraper, "HOST_MIN_INTERVAL", 0.5)
+    monkeypatch.setattr(scraper, "_host_next_slot", {})
+    monkeypatch.setattr(scraper, "fetch_url", fake_fetch_url)
+    urls = [
+        "http://busy.example.com/1",
+        "http://busy.example.com/2",
+        "http://example.com",
+    ]
+    results = scraper.iter_scrape_results(urls, max_workers=1)
+    # The second host is fetched while the busy host's second request waits
+    assert [url for url, _content in results][-1] == urls[1]
+    assert fetched[urls[2]] < 0.25
+    assert fetched[urls[1]] - fetched[urls[0]] >= 0.45
+
+
+def test_iter_scrape_results_async_busy_host_does_not_delay_other_hosts(monkeypatch):
+    aiohttp = pytest.importorskip("aiohttp")
+    fetched = {}
+    start = scraper.time.monotonic()
+    real_validate = scraper.validate_url
+
+    def late_validate(url):
+        if "busy" not in url:
+            scraper.time.sleep(0.05)  # Queue up behind the busy host's requests
+        return real_validate(url)
+
+    class FakeResponse:
+        def __init__(self, url):
+            self.url = url
+            self.content = self
+
+        async def __aenter__(self):
+            fetched[self.url] = scraper.time.monotonic() - start
+            return self
+
+        async def __aexit__(self, *exc):
+            pass
+
+        def raise_for_status(self):
+            pass
+
+        async def iter_chunked(self, size):
+            yield HTML
+
+    class FakeSession:
+        def __init__(self, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            pass
+
+        def get(self, api_url, headers=None, timeout=None):
+            return FakeResponse(api_urls[api_url])
+
+    monkeypatch.setattr(scraper, "HOST_MIN_INTERVAL", 0.5)
+    monkeypatch.setattr(scraper, "_host_next_slot", {})
+    monkeypatch.setattr(scraper, "validate_url", late_validate)
+    monkeypatch.setattr(aiohttp, "ClientSession", FakeSession)
+    monkeypatch.setattr(aiohttp, "TCPConnector", lambda **kwargs: None)
+    urls = [
+        "http://busy.example.com/1",
+        "http://busy.example.com/2",
+        "http://example.com",
+    ]
+    api_urls = {scraper.build_api_url(url): url for url in urls}
+
+    async def collect():
+        results = scraper.iter_scrape_results_async(urls, concurrency=1)
+        return [url async for url, _content in results]
+
+    assert asyncio.run(collect())[-1] == urls[1]
+    assert fetched[urls[2]] < 0.25
+    assert fetched[urls[1]] - fetched[urls[0]] >= 0.45
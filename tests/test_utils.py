@@ -1,6 +1,9 @@
 import os
 import logging
+import re
 import stat
+import sys
+import time
 
 os.environ.setdefault("SCRAPER_API_KEY", "test")
 os.environ.setdefault("SCRAPER_LOG_DIR", "/tmp/scraper_logs")
@@ -29,3 +32,243 @@ def test_configure_logging_sets_strict_permissions(tmp_path, monkeypatch):
     assert log_path is not None
     mode = stat.S_IMODE(os.stat(log_path).st_mode)
     assert mode == 0o600
+
+
+def test_parse_url_is_memoized():
+    from utils import parse_url
+
+    first = parse_url("https://example.com/a?b=1")
+    assert first.netloc == "example.com"
+    assert parse_url("https://example.com/a?b=1") is first
+
+
+def test_log_json_skips_serialization_when_level_disabled(monkeypatch):
+    import utils
+
+    def fail_dumps(*args, **kwargs):
+        raise AssertionError("serialized a disabled record")
+
+    logger = logging.getLogger("test_log_json_disabled")
+    logger.setLevel(logging.INFO)
+    monkeypatch.setattr(utils, "_dumps", fail_dumps)
+    utils.log_json(logger, logging.DEBUG, "msg", url="http://example.com")
+
+
+def test_default_log_directory_is_cached(monkeypatch):
+    import utils
+
+    utils.get_default_log_directory.cache_clear()
+    calls = []
+    monkeypatch.setattr(utils.platform, "system", lambda: calls.append(1) or "Darwin")
+    first = utils.get_default_log_directory()
+    assert utils.get_default_log_directory() == first
+    assert len(calls) == 1
+    utils.get_default_log_directory.cache_clear()
+
+
+def test_log_json_emits_parseable_sanitized_json(caplog):
+    import json
+    import utils
+
+    logger = logging.getLogger("test_log_json_enabled")
+    with caplog.at_level(logging.INFO, logger="test_log_json_enabled"):
+        utils.log_json(logger, logging.INFO, "msg", url="http://exa\r\nmple.com", n=1)
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record == {"message": "msg", "url": "http://example.com", "n": 1}
+
+
+def test_get_logger_defaults_to_caller_module():
+    from utils import get_logger
+
+    assert get_logger().name == __name__
+    assert get_logger("explicit").name == "explicit"
+
+
+def test_get_logger_caches_named_loggers():
+    import utils
+
+    first = utils.get_logger("cached.logger")
+    hits = utils._cached_logger.cache_info().hits
+    assert utils.get_logger("cached.logger") is first
+    assert utils._cached_logger.cache_info().hits == hits + 1
+
+
+def test_configure_logging_keeps_handlers_on_repeat_call(tmp_path):
+    log_path = configure_logging(log_dir=str(tmp_path))
+    handlers = list(logging.getLogger().handlers)
+    assert configure_logging(log_dir=str(tmp_path)) == log_path
+    assert logging.getLogger().handlers == handlers
+
+    configure_logging(log_dir=str(tmp_path), log_level=logging.DEBUG)
+    assert logging.getLogger().handlers != handlers
+    assert len(logging.getLogger().handlers) == 1
+
+
+def test_buffered_handler_batches_until_warning_and_rotates(tmp_path):
+    from utils import BufferedRotatingHandler
+
+    path = tmp_path / "app.log"
+    handler = BufferedRotatingHandler(str(path), max_bytes=40, backup_count=2)
+    logger = logging.getLogger("test_buffered_handler")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.warning("first warning")
+        assert path.read_text(encoding="utf-8") == "first warning\n"
+        logger.info("queued")
+        assert path.read_text(encoding="utf-8") == "first warning\n"
+        handler.flush()
+        assert path.read_text(encoding="utf-8") == "first warning\nqueued\n"
+
+        logger.warning("pushes the file past max_bytes")
+        assert path.read_text(encoding="utf-8") == "pushes the file past max_bytes\n"
+        assert (tmp_path / "app.log.1").read_text(encoding="utf-8") == (
+            "first warning\nqueued\n"
+        )
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_configure_logging_writes_through_background_listener(tmp_path):
+    from logging.handlers import QueueHandler
+
+    from utils import shutdown_logging
+
+    log_path = configure_logging(log_dir=str(tmp_path), log_level=logging.INFO)
+    (root_handler,) = logging.getLogger().handlers
+    assert isinstance(root_handler, QueueHandler)
+    logging.getLogger("test_listener").info("queued %s", "record")
+    shutdown_logging()
+    with open(log_path, encoding="utf-8") as fh:
+        last_line = fh.read().splitlines()[-1]
+    assert re.fullmatch(
+        r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d - test_listener - INFO - "
+        r"test_configure_logging_writes_through_background_listener:\d+ - "
+        r"queued record",
+        last_line,
+    )
+
+
+def test_ensure_directory_exists_caches_created_dirs(tmp_path, monkeypatch, capsys):
+    import utils
+
+    nested = tmp_path / "a" / "b"
+    assert utils.ensure_directory_exists(str(nested))
+    assert nested.is_dir()
+    (tmp_path / "file").write_text("x")
+    assert not utils.ensure_directory_exists(str(tmp_path / "file"))
+    assert "Could not create log directory" in capsys.readouterr().err
+
+    def fail(*args, **kwargs):
+        raise AssertionError("known directory should not be re-created")
+
+    monkeypatch.setattr(utils.os, "mkdir", fail)
+    assert utils.ensure_directory_exists(str(nested))
+
+
+def test_configure_logging_keeps_caller_info_for_other_loggers(tmp_path):
+    from logging.handlers import BufferingHandler
+
+    from utils import _FILE_FORMATTER
+
+    configure_logging(log_dir=str(tmp_path), log_level=logging.INFO)
+    captured = BufferingHandler(10)
+    logger = logging.getLogger("test_caller")
+    logger.addHandler(captured)
+    try:
+        logger.warning("msg")
+    finally:
+        logger.removeHandler(captured)
+    (record,) = captured.buffer
+    assert record.filename == "test_utils.py" and record.lineno > 0
+    assert record.funcName.startswith("test_configure_logging_keeps_caller")
+    assert "%(funcName)s:%(lineno)d" in _FILE_FORMATTER._fmt
+
+
+def test_formatter_renders_asctime_once_per_second():
+    from utils import _SecondCachedFormatter
+
+    formatter = _SecondCachedFormatter("%(asctime)s %(message)s", datefmt="%H:%M:%S")
+    calls = []
+    formatter.converter = lambda t: calls.append(t) or time.gmtime(t)
+
+    def make(created, msg):
+        record = logging.makeLogRecord({"msg": msg})
+        record.created = created
+        return formatter.format(record)
+
+    assert make(3600.2, "a") == "01:00:00 a"
+    assert make(3600.9, "b") == "01:00:00 b"
+    assert make(3601.0, "c") == "01:00:01 c"
+    assert len(calls) == 2
+
+
+def test_layout_formatters_match_percent_style_output():
+    from utils import _CONSOLE_FORMATTER, _FILE_FORMATTER
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    for exc in (None, exc_info):
+        record = logging.getLogger("test_layout").makeRecord(
+            "test_layout", logging.WARNING, "fn", 1, "x=%s", (1,), exc
+        )
+        for fast in (_FILE_FORMATTER, _CONSOLE_FORMATTER):
+            stock = logging.Formatter(fast._fmt, datefmt=fast.datefmt)
+            record.exc_text = None
+            expected = stock.format(record)
+            record.exc_text = None
+            assert fast.format(record) == expected
+
+
+def test_running_on_android_skips_platform_string(monkeypatch):
+    import platform
+
+    import utils
+
+    def fail():
+        raise AssertionError("platform.platform() should not be parsed")
+
+    monkeypatch.setattr(platform, "platform", fail)
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    monkeypatch.setattr(
+        utils.os.path, "exists", lambda path: path == "/system/build.prop"
+    )
+    utils.running_on_android.cache_clear()
+    try:
+        assert utils.running_on_android()
+    finally:
+        utils.running_on_android.cache_clear()
+
+
+def test_buffered_handler_flush_level_and_interval(tmp_path):
+    from utils import BufferedRotatingHandler
+
+    path = tmp_path / "app.log"
+    handler = BufferedRotatingHandler(
+        str(path), flush_level=logging.ERROR, flush_interval=0.01
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "slow", "levelno": 30}))
+        deadline = time.monotonic() + 2
+        while not path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert path.read_text(encoding="utf-8") == "slow\n"
+    finally:
+        handler.close()
+    assert handler._stopped.is_set()
+
+
+def test_set_log_level_only_changes_root_level(tmp_path):
+    from utils import set_log_level
+
+    configure_logging(log_dir=str(tmp_path), log_level=logging.INFO)
+    set_log_level("WARNING")
+    root = logging.getLogger()
+    assert root.level == logging.WARNING
+    assert [h.level for h in root.handlers] == [logging.NOTSET]
+    set_log_level(logging.INFO)
@@ -1,4 +1,5 @@
 import os
+from collections import OrderedDict
 
 os.environ.setdefault("SCRAPER_API_KEY", "test")
 
@@ -25,3 +26,61 @@ def test_non_http_scheme_rejected():
     assert not scraper.validate_url("ftp://example.com")
     assert not scraper.validate_url("javascript:alert(1)")
     assert not scraper.validate_url("file:///etc/passwd")
+
+
+def test_dns_checks_are_cached_per_host(monkeypatch):
+    calls = []
+
+    def fake_getaddrinfo(host, port, *args):
+        calls.append(host)
+        return [(None, None, None, "", ("93.184.216.34", 0))]
+
+    monkeypatch.setattr(scraper.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(scraper, "_host_checks", OrderedDict())
+
+    assert scraper.validate_url("http://cached.example/a")
+    assert scraper.validate_url("http://cached.example/b")
+    assert calls == ["cached.example"]
+
+    monkeypatch.setattr(scraper, "DNS_CACHE_TTL", 0)
+    monkeypatch.setattr(scraper, "_host_checks", OrderedDict())
+    assert scraper.validate_url("http://cached.example/a")
+    assert scraper.validate_url("http://cached.example/a")
+    assert calls == ["cached.example"] * 3
+
+
+def test_dns_lookup_requests_stream_addresses_only(monkeypatch):
+    captured = {}
+
+    def fake_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        captured.update(family=family, type=type, flags=flags)
+        return [(None, None, None, "", ("93.184.216.34", 0))]
+
+    monkeypatch.setattr(scraper.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(scraper, "_host_checks", OrderedDict())
+    monkeypatch.setattr(scraper, "DNS_FAMILY", scraper.socket.AF_INET)
+
+    assert scraper.validate_url("http://hints.example")
+    assert captured == {
+        "family": scraper.socket.AF_INET,
+        "type": scraper.socket.SOCK_STREAM,
+        "flags": scraper.socket.AI_NUMERICSERV,
+    }
+
+
+def test_dns_check_cache_evicts_least_recently_used(monkeypatch):
+    calls = []
+
+    def fake_getaddrinfo(host, port, *args):
+        calls.append(host)
+        return [(None, None, None, "", ("93.184.216.34", 0))]
+
+    monkeypatch.setattr(scraper.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(scraper, "_host_checks", OrderedDict())
+    monkeypatch.setattr(scraper, "HOST_CHECK_CACHE_SIZE", 2)
+
+    for host in ("a", "b", "a", "c"):  # "b" is least recently used when "c" lands
+        assert scraper.validate_url(f"http://{host}.example")
+    assert list(scraper._host_checks) == ["a.example", "c.example"]
+    assert scraper.validate_url("http://b.example")
+    assert calls == ["a.example", "b.example", "c.example", "b.example"]
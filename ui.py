@@ -1,14 +1,17 @@
+import functools
 import json
 import os
 import platform
-import re
+import stat
 import threading
-from datetime import datetime
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from kivy.app import App
-from kivy.clock import Clock
+from kivy.clock import Clock, mainthread
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.checkbox import CheckBox
@@ -20,17 +23,77 @@ from kivy.uix.textinput import TextInput
 from kivy.utils import platform as kivy_platform
 
 from progress_tracker import ScrapingProgressTracker
-from scraper import validate_url
-from utils import configure_logging, get_logger
+from scraper import scrape_urls_to_files, validate_url
+from utils import configure_logging, get_logger, running_on_android
 
+try:
+    import orjson
+except ImportError:  # Optional fast JSON codec; the stdlib encoder is used without it
+    orjson = None
 
+# Shared by all widgets; exposed as a class attribute so instances can override it
+_LOG = get_logger(__name__)
+
+URL_PREFIXES = ("http://", "https://")
+# Longer inputs are rejected before reaching the full validator
+MAX_URL_LENGTH = 2048
+# More underscores than this in the host part marks pathological input
+MAX_HOST_UNDERSCORES = 20
+
+
+class _SafeNameTable(dict):
+    """``str.translate`` table keeping ``[A-Za-z0-9_-]`` and mapping all else to ``_``.
+
+    Entries are filled in on first sight, so repeated characters translate in C.
+    """
+
+    _ALLOWED = frozenset(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+    )
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        value = char if char in self._ALLOWED else "_"
+        self[codepoint] = value
+        return value
+
+
+SAFE_NAME_TABLE = _SafeNameTable()
+
+# (whole second, ISO string) of the last formatted UTC timestamp
+_utc_stamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SSZ``, cached per second."""
+    global _utc_stamp_cache
+    now = int(time.time())
+    if _utc_stamp_cache[0] != now:
+        stamp = datetime.fromtimestamp(now, tz=timezone.utc)
+        _utc_stamp_cache = (now, stamp.strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return _utc_stamp_cache[1]
+
+
+# Validation debounce: the first edit after this much quiet validates at once,
+# then a trailing pass runs once typing pauses. The pause scales with input
+# size so large pastes are not re-scanned mid-edit.
+VALIDATION_IDLE_GAP = 1.0
+VALIDATION_MIN_DELAY = 0.3
+VALIDATION_MAX_DELAY = 2.0
+VALIDATION_CHARS_PER_SECOND = 20_000
+# Seconds after the last Apply before the autosave template is written
+AUTOSAVE_DELAY = 2.0
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_output_directory():
-    """Get the appropriate output directory based on the operating system."""
+    """Get the appropriate output directory based on the operating system.
+
+    Cached: the platform probes are fixed for the life of the process.
+    """
     system_name = platform.system().lower()
 
-    if kivy_platform == "android" or (
-        system_name == "linux" and "android" in platform.platform().lower()
-    ):
+    if kivy_platform == "android" or running_on_android():
         # Android path
         return "/storage/emulated/0/ScraperApp/scraped_data"
     elif system_name == "windows":
@@ -48,9 +111,10 @@ def get_default_output_directory():
 class EnhancedURLInput(BoxLayout):
     """Widget for URL entry with validation and optional file import."""
 
+    logger = _LOG
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(orientation="vertical", **kwargs)
-        self.logger = get_logger(__name__)
 
         self.text_input = TextInput(
             hint_text=(
@@ -74,39 +138,160 @@ class EnhancedURLInput(BoxLayout):
 
         self.valid_urls: List[str] = []
         self.invalid_urls: List[str] = []
+        # URL -> validity from the previous pass, so debounce ticks over
+        # unchanged lines skip validation
+        self._valid_cache: Dict[str, bool] = {}
+        self._validated_text: Optional[str] = None
+        self._requested_text: Optional[str] = None
+        # Bumped per validation request; stale background results are dropped
+        self._validation_generation = 0
+        # Validation resolves hostnames, so it runs off the UI thread
+        self._validation_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="url-validation"
+        )
         self._validation_event = None
+        self._last_edit_time = 0.0
+        self._file_popup: Optional[Popup] = None
         self.text_input.bind(text=self._on_text_change)
 
     def _on_text_change(self, *_: Any) -> None:
         if self._validation_event:
             self._validation_event.cancel()
-        # Debounce validation to avoid excessive processing
-        self._validation_event = Clock.schedule_once(self._validate_urls, 0.5)
+        now = time.monotonic()
+        idle = now - self._last_edit_time > VALIDATION_IDLE_GAP
+        self._last_edit_time = now
+        if idle:
+            # Leading edge: immediate feedback on the first edit of a burst
+            self._validate_in_background()
+        # Trailing edge: debounce the rest of the burst
+        delay = min(
+            VALIDATION_MAX_DELAY,
+            VALIDATION_MIN_DELAY
+            + len(self.text_input.text) / VALIDATION_CHARS_PER_SECOND,
+        )
+        self._validation_event = Clock.schedule_once(
+            self._validate_in_background, delay
+        )
 
-    def _validate_urls(self, *_: Any) -> None:
-        raw_text = self.text_input.text.strip()
-        urls = [u.strip() for u in re.split(r"[,\n]+", raw_text) if u.strip()]
-        self.valid_urls = []
-        self.invalid_urls = []
+    def _is_valid_url(self, url: str) -> bool:
+        """Check ``url`` cheaply first, then with the full ``validate_url``."""
+        if len(url) > MAX_URL_LENGTH or not url[:8].lower().startswith(URL_PREFIXES):
+            return False
+        # Underscore-stuffed hosts are never resolvable; reject them structurally
+        authority = url[url.index("://") + 3 :].split("/", 1)[0]
+        if "____" in authority or authority.count("_") > MAX_HOST_UNDERSCORES:
+            return False
+        return validate_url(url)
+
+    def _classify_urls(
+        self, raw_text: str, previous: Dict[str, bool]
+    ) -> Tuple[List[str], List[str], Dict[str, bool]]:
+        """Split ``raw_text`` into ``(valid, invalid, cache)``.
+
+        Reads only its arguments, so it is safe to run on a worker thread.
+        """
+        # URLs are separated by commas or whitespace; split() drops empty tokens
+        urls = raw_text.replace(",", " ").split()
+        valid_urls: List[str] = []
+        invalid_urls: List[str] = []
+        # Rebuilt from the current lines only, so it never outgrows the input
+        cache: Dict[str, bool] = {}
         for url in urls:
-            if validate_url(url):
-                self.valid_urls.append(url)
+            valid = cache.get(url)
+            if valid is None:
+                valid = previous.get(url)
+                if valid is None:
+                    valid = self._is_valid_url(url)
+                cache[url] = valid
+            if valid:
+                valid_urls.append(url)
             else:
-                self.invalid_urls.append(url)
-        if not urls:
+                invalid_urls.append(url)
+        return valid_urls, invalid_urls, cache
+
+    def _apply_validation(
+        self,
+        generation: int,
+        raw_text: str,
+        valid_urls: List[str],
+        invalid_urls: List[str],
+        cache: Dict[str, bool],
+    ) -> None:
+        if generation != self._validation_generation:
+            return  # Superseded by a newer request
+        self.valid_urls = valid_urls
+        self.invalid_urls = invalid_urls
+        self._valid_cache = cache
+        self._validated_text = raw_text
+        if not valid_urls and not invalid_urls:
             self.status_label.text = "Enter URLs..."
         else:
             self.status_label.text = (
                 f"{len(self.valid_urls)} valid / {len(self.invalid_urls)} invalid"
             )
 
+    @mainthread
+    def _deliver_validation(self, *args: Any) -> None:
+        self._apply_validation(*args)
+
+    def _run_validation(
+        self, generation: int, raw_text: str, previous: Dict[str, bool]
+    ) -> None:
+        try:
+            results = self._classify_urls(raw_text, previous)
+        except Exception as exc:  # Keep the worker alive for later requests
+            self.logger.error("URL validation failed: %s", exc)
+            return
+        self._deliver_validation(generation, raw_text, *results)
+
+    def _validate_in_background(self, *_: Any) -> None:
+        """Validate the current text on the worker; results apply on the UI thread."""
+        raw_text = self.text_input.text.strip()
+        if raw_text == self._requested_text:
+            return  # Already validated or in flight
+        self._requested_text = raw_text
+        self._validation_generation += 1
+        self._validation_pool.submit(
+            self._run_validation,
+            self._validation_generation,
+            raw_text,
+            self._valid_cache,
+        )
+
+    def _validate_urls(self, *_: Any) -> None:
+        """Validate the current text synchronously, superseding pending work."""
+        raw_text = self.text_input.text.strip()
+        if raw_text == self._validated_text:
+            return  # Nothing changed since the last pass
+        self._requested_text = raw_text
+        self._validation_generation += 1
+        self._apply_validation(
+            self._validation_generation,
+            raw_text,
+            *self._classify_urls(raw_text, self._valid_cache),
+        )
+
     def _open_file_chooser(self, _instance: Button) -> None:
-        chooser = FileChooserListView()
-        popup = Popup(title="Select URL file", content=chooser, size_hint=(0.9, 0.9))
-        chooser.bind(
+        # Built on first use and reused; reopening only re-lists the directory
+        if self._file_popup is None:
+            self._file_popup = self._build_file_popup()
+        else:
+            chooser = self._file_chooser
+            chooser.selection = []
+            # Re-dispatching an unchanged ``filters`` triggers the chooser's own
+            # re-list without touching its path history
+            chooser.property("filters").dispatch(chooser)
+        self._file_popup.open()
+
+    def _build_file_popup(self) -> Popup:
+        self._file_chooser = FileChooserListView()
+        popup = Popup(
+            title="Select URL file", content=self._file_chooser, size_hint=(0.9, 0.9)
+        )
+        self._file_chooser.bind(
             on_submit=lambda inst, selection, touch: self._file_chosen(popup, selection)
         )
-        popup.open()
+        return popup
 
     def _file_chosen(self, popup: Popup, selection: List[str]) -> None:
         popup.dismiss()
@@ -115,19 +300,31 @@ class EnhancedURLInput(BoxLayout):
 
     def _load_file(self, file_path: str) -> None:
         try:
-            path = Path(file_path).expanduser().resolve()
-            if not path.is_file() or path.stat().st_size > 1_000_000:
-                raise ValueError("Invalid file")
-            # Security: read file safely with explicit encoding
-            content = path.read_text(encoding="utf-8")
+            # One open and one fstat; O_NONBLOCK keeps a FIFO from blocking
+            fd = os.open(
+                os.path.expanduser(file_path),
+                os.O_RDONLY | getattr(os, "O_NONBLOCK", 0),
+            )
+            try:
+                st = os.fstat(fd)
+                if not stat.S_ISREG(st.st_mode) or st.st_size > 1_000_000:
+                    raise ValueError("Invalid file")
+                fh = os.fdopen(fd, "r", encoding="utf-8")
+            except BaseException:
+                # The file object owns the descriptor only once fdopen succeeds
+                os.close(fd)
+                raise
+            with fh:
+                # Security: read file safely with explicit encoding
+                content = fh.read()
         except Exception as exc:  # Security: broad catch to avoid leaking errors
             self.logger.error("Failed to import URLs: %s", exc)
             self.status_label.text = "File load failed"
             return
-        if self.text_input.text:
-            self.text_input.text += "\n"
-        self.text_input.text += content
-        self._validate_urls()
+        existing = self.text_input.text
+        # A single assignment re-lays out the TextInput and fires on_text once;
+        # that change schedules validation on the background worker
+        self.text_input.text = f"{existing}\n{content}" if existing else content
 
     def get_valid_urls(self) -> List[str]:
         """Return currently valid URLs."""
@@ -148,11 +345,21 @@ class ConfigurationManager(BoxLayout):
         "create_subdirectories": False,  # Boolean
     }
 
+    logger = _LOG
+    # Config directories already created, so later instances skip the mkdir
+    _ready_config_dirs: Set[str] = set()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(orientation="vertical", **kwargs)
-        self.logger = get_logger(__name__)
         self.config: Dict[str, Any] = dict(self.default_config)
         self._config_dir = self._get_config_directory()
+        self._settings_popup: Optional[Popup] = None
+        # Autosave is debounced and written off the UI thread; one worker
+        # keeps the writes in order
+        self._autosave_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="config-autosave"
+        )
+        self._autosave_event = None
 
         # Simple button to open settings dialog
         settings_btn = Button(text="Settings", size_hint=(1, None), height=40)
@@ -162,16 +369,19 @@ class ConfigurationManager(BoxLayout):
     def _get_config_directory(self) -> str:
         """Return path to configuration directory, creating it securely."""
         base = Path(get_default_output_directory()).expanduser()
-        config_dir = base.parent / "config_templates"
+        config_dir = str(base.parent / "config_templates")
+        if config_dir in self._ready_config_dirs:
+            return config_dir
         try:
             # Security: restrict permissions to user-only where supported
-            config_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            Path(config_dir).mkdir(parents=True, exist_ok=True, mode=0o700)
+            self._ready_config_dirs.add(config_dir)
         except Exception as exc:  # Broad catch to avoid leaking details
             self.logger.error("Failed to create config directory: %s", exc)
-        return str(config_dir)
+        return config_dir
 
     def _sanitize_name(self, name: str) -> str:
-        return re.sub(r"[^A-Za-z0-9_-]", "_", name)
+        return name.translate(SAFE_NAME_TABLE)
 
     def _validate_config(self, config: Dict[str, Any]) -> None:
         if config.get("output_format") not in {"txt", "md"}:
@@ -192,42 +402,96 @@ class ConfigurationManager(BoxLayout):
         if not isinstance(config.get("create_subdirectories"), bool):
             raise ValueError("create_subdirectories must be boolean")
 
-    def _save_template(self, name: str) -> bool:
-        """Persist current config as JSON template."""
+    def _schedule_autosave(self) -> None:
+        """Write the autosave template once settings stop changing."""
+        if self._autosave_event:
+            self._autosave_event.cancel()
+        self._autosave_event = Clock.schedule_once(self._start_autosave, AUTOSAVE_DELAY)
+
+    def _start_autosave(self, *_: Any) -> None:
+        self._autosave_event = None
+        # Snapshot on the UI thread so the worker never sees a half-applied update
+        self._autosave_pool.submit(self._save_template, "autosave", dict(self.config))
+
+    def flush_autosave(self) -> None:
+        """Write a pending debounced autosave now and wait for queued writes."""
+        event, self._autosave_event = self._autosave_event, None
+        if event is not None:
+            event.cancel()
+            last = self._autosave_pool.submit(
+                self._save_template, "autosave", dict(self.config)
+            )
+        else:
+            last = self._autosave_pool.submit(lambda: None)
+        # The single worker runs jobs in order, so this waits for every write
+        last.result()
+
+    def _save_template(
+        self, name: str, config: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Persist ``config`` (default: the current config) as JSON template."""
         safe_name = self._sanitize_name(name)
         if not safe_name:
             self.logger.error("Invalid template name")
             return False
         data = {
             "name": safe_name,
-            "created": datetime.utcnow().isoformat() + "Z",
-            "config": self.config,
+            "created": _utc_timestamp(),
+            "config": self.config if config is None else config,
         }
         try:
             path = Path(self._config_dir) / f"{safe_name}.json"
-            with path.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, ensure_ascii=False, indent=2)
+            # Encode up front so the file is written in one call
+            if orjson is not None:
+                payload = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                )
+            else:
+                payload = json.dumps(
+                    data, ensure_ascii=False, indent=2, sort_keys=True
+                ).encode("utf-8")
+            # Atomic so a crash mid-write never leaves a truncated template
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
             return True
         except Exception as exc:
             self.logger.error("Failed to save template: %s", exc)
             return False
 
     def open_settings(self) -> None:
+        # Build the dialog once and only refresh its fields on later opens
+        if self._settings_popup is None:
+            self._settings_popup = self._build_settings_popup()
+        self._refresh_settings_fields()
+        self._settings_popup.open()
+
+    def _refresh_settings_fields(self) -> None:
+        """Copy the current config into the settings widgets."""
+        self.output_format_input.text = self.config["output_format"]
+        self.auto_scroll_checkbox.active = self.config["auto_scroll_log"]
+        self.template_input.text = self.config["filename_template"]
+        self.workers_input.text = str(self.config["concurrent_workers"])
+        self.timeout_input.text = str(self.config["request_timeout"])
+        self.retry_input.text = str(self.config["retry_attempts"])
+        self.subdir_checkbox.active = self.config["create_subdirectories"]
+
+    def _build_settings_popup(self) -> Popup:
         panel = TabbedPanel(do_default_tab=False)
 
         # General tab
         general_box = BoxLayout(orientation="vertical", padding=10, spacing=10)
-        self.output_format_input = TextInput(text=self.config["output_format"])
+        self.output_format_input = TextInput()
         general_box.add_widget(Label(text="Output Format (txt/md)"))
         general_box.add_widget(self.output_format_input)
 
-        self.auto_scroll_checkbox = CheckBox(active=self.config["auto_scroll_log"])
+        self.auto_scroll_checkbox = CheckBox()
         auto_layout = BoxLayout(size_hint_y=None, height=30)
         auto_layout.add_widget(Label(text="Auto scroll log", size_hint_x=0.7))
         auto_layout.add_widget(self.auto_scroll_checkbox)
         general_box.add_widget(auto_layout)
 
-        self.template_input = TextInput(text=self.config["filename_template"])
+        self.template_input = TextInput()
         general_box.add_widget(Label(text="Filename template"))
         general_box.add_widget(self.template_input)
 
@@ -237,27 +501,19 @@ class ConfigurationManager(BoxLayout):
 
         # Advanced tab
         advanced_box = BoxLayout(orientation="vertical", padding=10, spacing=10)
-        self.workers_input = TextInput(
-            text=str(self.config["concurrent_workers"]), input_filter="int"
-        )
+        self.workers_input = TextInput(input_filter="int")
         advanced_box.add_widget(Label(text="Concurrent workers"))
         advanced_box.add_widget(self.workers_input)
 
-        self.timeout_input = TextInput(
-            text=str(self.config["request_timeout"]), input_filter="int"
-        )
+        self.timeout_input = TextInput(input_filter="int")
         advanced_box.add_widget(Label(text="Request timeout (s)"))
         advanced_box.add_widget(self.timeout_input)
 
-        self.retry_input = TextInput(
-            text=str(self.config["retry_attempts"]), input_filter="int"
-        )
+        self.retry_input = TextInput(input_filter="int")
         advanced_box.add_widget(Label(text="Retry attempts"))
         advanced_box.add_widget(self.retry_input)
 
-        self.subdir_checkbox = CheckBox(
-            active=self.config["create_subdirectories"], size_hint_x=None
-        )
+        self.subdir_checkbox = CheckBox(size_hint_x=None)
         subdir_layout = BoxLayout(size_hint_y=None, height=30)
         subdir_layout.add_widget(Label(text="Create subdirectories", size_hint_x=0.7))
         subdir_layout.add_widget(self.subdir_checkbox)
@@ -274,7 +530,7 @@ class ConfigurationManager(BoxLayout):
         root.add_widget(save_btn)
         popup = Popup(title="Advanced Settings", content=root, size_hint=(0.9, 0.9))
         save_btn.bind(on_press=lambda *_: self._apply_settings(popup))  # type: ignore
-        popup.open()
+        return popup
 
     def _apply_settings(self, popup: Popup) -> None:
         new_config = {
@@ -292,13 +548,15 @@ class ConfigurationManager(BoxLayout):
             self.logger.error("Invalid configuration: %s", exc)
             return
         self.config.update(new_config)
-        self._save_template("autosave")
+        self._schedule_autosave()
         popup.dismiss()
 
 
 class ModernScraperApp(App):
     """Tabbed UI for web scraping with shared state."""
 
+    logger = _LOG
+
     def __init__(
         self,
         url_input_cls: Any = EnhancedURLInput,
@@ -307,7 +565,6 @@ class ModernScraperApp(App):
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
-        self.logger = get_logger(__name__)
         # Store widget classes for deferred instantiation
         self.url_input_cls = url_input_cls
         self.progress_cls = progress_cls
@@ -319,6 +576,13 @@ class ModernScraperApp(App):
         # Centralized state guarded by a lock for thread safety
         self.app_state: Dict[str, Any] = {}
         self.state_lock = threading.Lock()
+        # One long-lived worker runs scrape jobs; a job in flight blocks new
+        # ones so repeated clicks cannot overlap writes to the output directory
+        self._scrape_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scrape"
+        )
+        self._scrape_future: Optional[Future] = None
+        self._stop_event = threading.Event()
 
     def build(self) -> TabbedPanel:
         configure_logging()
@@ -349,16 +613,64 @@ class ModernScraperApp(App):
         return panel
 
     def start_scraping(self) -> None:
-        """Validate URLs and start tracking."""
-        urls = [u for u in self.url_input.get_valid_urls() if validate_url(u)]
+        """Validate URLs, start tracking and scrape them on the worker thread."""
+        if self._scrape_future is not None and not self._scrape_future.done():
+            self.logger.warning("Scraping already in progress")
+            return
+        # get_valid_urls reuses the last validation pass when the text is unchanged
+        valid_urls = self.url_input.get_valid_urls()
+        # Pasted lists often repeat URLs; fetch each once, in first-seen order
+        urls = list(dict.fromkeys(valid_urls))
+        if len(urls) < len(valid_urls):
+            self.logger.info("Skipped %d duplicate URLs", len(valid_urls) - len(urls))
         with self.state_lock:
             self.app_state["urls"] = urls
             self.app_state["is_scraping"] = True
-        for url in urls:
-            self.progress_tracker.add_url(url)
-        # Real scraping would be initiated here.
+        self.progress_tracker.add_urls(urls)
+        config = dict(self.config_manager.config)
+        self.progress_tracker.auto_scroll = config["auto_scroll_log"]
+        self._stop_event.clear()
+        # The job fetches on its own asyncio loop, so all URLs overlap their
+        # network waits on this one worker thread
+        self._scrape_future = self._scrape_executor.submit(
+            scrape_urls_to_files,
+            urls,
+            get_default_output_directory(),
+            config["output_format"],
+            config["concurrent_workers"],
+            use_async=True,
+            on_result=self._report_result,
+            stop_event=self._stop_event,
+        )
+        self._scrape_future.add_done_callback(self._finish_scraping)
+
+    def _report_result(self, url: str, ok: bool) -> None:
+        # Runs on the scrape thread; the tracker batches updates onto the UI
+        status = "completed" if ok else "failed"
+        self.progress_tracker.update_url_progress(url, status)
+        self.progress_tracker.log_message(f"{status}: {url}")
+
+    @mainthread
+    def _finish_scraping(self, future: Future) -> None:
+        with self.state_lock:
+            self.app_state["is_scraping"] = False
+        exc = future.exception()
+        if exc is not None:
+            self.logger.error("Scraping failed: %s", exc)
+        else:
+            self.logger.info("Scraping finished: %d files saved", len(future.result()))
+
+    def on_stop(self) -> None:
+        """Stop any running scrape and persist pending settings before exit."""
+        # The scrape worker is not a daemon thread; without this a run in
+        # progress would keep the process alive after the window closes
+        self.stop_scraping()
+        self._scrape_executor.shutdown(wait=False, cancel_futures=True)
+        if self.config_manager is not None:
+            self.config_manager.flush_autosave()
 
     def stop_scraping(self) -> None:
-        """Signal that scraping should stop."""
+        """Signal that scraping should stop; pending requests are cancelled."""
+        self._stop_event.set()
         with self.state_lock:
             self.app_state["is_scraping"] = False
@@ -1,36 +1,84 @@
+import atexit
+import functools
+import io
 import json
 import logging
 import os
 import sys
 import platform
+import queue
 import stat
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import Any, Optional, Union
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional, Set, Tuple, Union
+from urllib.parse import ParseResult, urlparse
 
+try:
+    import orjson
+except ImportError:  # Optional fast JSON codec; the stdlib encoder is used without it
+    orjson = None
 
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    _dumps = json.dumps
+
+# Newline and carriage-return characters removed by sanitize_url
+_URL_CONTROL_CHARS = str.maketrans("", "", "\r\n")
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_url(url: str) -> str:
     """Remove newline and carriage-return characters from a URL."""
-    return url.replace("\n", "").replace("\r", "")
+    return url.translate(_URL_CONTROL_CHARS)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_url(url: str) -> ParseResult:
+    """Memoized ``urlparse``; the result is an immutable named tuple."""
+    return urlparse(url)
 
 
 def log_json(logger: logging.Logger, level: int, message: str, **kwargs: Any) -> None:
     """Log a structured JSON message with optional sanitization."""
+    # Skip sanitizing and serializing records that would be dropped anyway
+    if not logger.isEnabledFor(level):
+        return
     if "url" in kwargs and isinstance(kwargs["url"], str):
         kwargs["url"] = sanitize_url(kwargs["url"])
-    logger.log(level, json.dumps({"message": message, **kwargs}))
+    logger.log(level, _dumps({"message": message, **kwargs}))
+
+
+@functools.lru_cache(maxsize=1)
+def running_on_android() -> bool:
+    """
+    Return True when the process runs on Android.
 
+    Uses the Android build of CPython or the system properties file instead of
+    parsing ``platform.platform()``, which is slow on Linux.
+    """
+    system = platform.system().lower()
+    if system == "android":
+        return True
+    return system == "linux" and (
+        hasattr(sys, "getandroidapilevel") or os.path.exists("/system/build.prop")
+    )
 
+
+@functools.lru_cache(maxsize=1)
 def get_default_log_directory() -> str:
     """
     Get the appropriate default log directory based on the operating system.
     Returns a cross-platform compatible path.
+
+    Cached, since the platform probes are fixed for the life of the process.
     """
     system = platform.system().lower()
 
-    if system == "android" or (
-        system == "linux" and "android" in platform.platform().lower()
-    ):
+    if system in ("android", "linux") and running_on_android():
         # Android path (if running on Android)
         return "/storage/emulated/0/scraper_logs"
     elif system == "windows":
@@ -48,22 +96,231 @@ def get_default_log_directory() -> str:
             return os.path.expanduser("~/.local/share/scraperapp/logs")
 
 
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` at most once per second.
+
+    Only suitable for a ``datefmt`` without sub-second fields.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._asctime: Tuple[Optional[int], str] = (None, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        second = int(record.created)
+        cached_second, text = self._asctime
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._asctime = (second, text)
+        return text
+
+
+class _LayoutFormatter(_SecondCachedFormatter):
+    """
+    Formatter for the fixed file and console layouts.
+
+    The file layout is ``asctime - name - levelname - funcName:lineno - message``
+    and the console layout ``asctime - levelname - message``. Each line is built
+    with one f-string instead of ``%`` substitution over the record's
+    ``__dict__``; exception and stack text are appended as usual.
+    """
+
+    def __init__(self, datefmt: str, detailed: bool) -> None:
+        if detailed:
+            fmt = (
+                "%(asctime)s - %(name)s - %(levelname)s - "
+                "%(funcName)s:%(lineno)d - %(message)s"
+            )
+        else:
+            fmt = "%(asctime)s - %(levelname)s - %(message)s"
+        super().__init__(fmt, datefmt=datefmt)
+        self._detailed = detailed
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        if self._detailed:
+            return (
+                f"{record.asctime} - {record.name} - {record.levelname} - "
+                f"{record.funcName}:{record.lineno} - {record.message}"
+            )
+        return f"{record.asctime} - {record.levelname} - {record.message}"
+
+
+# Formatters shared by every configure_logging call
+_FILE_FORMATTER = _LayoutFormatter("%Y-%m-%d %H:%M:%S", detailed=True)
+_CONSOLE_FORMATTER = _LayoutFormatter("%H:%M:%S", detailed=False)
+
+
+# Directories already known to exist, so repeat calls skip the syscalls
+_ready_directories: Set[str] = set()
+
+
 def ensure_directory_exists(directory_path: str) -> bool:
     """
     Ensure that a directory exists, creating it if necessary.
 
+    A single ``mkdir`` covers the common cases; parents are only walked when the
+    parent directory is missing.
+
     Args:
         directory_path (str): Path to the directory
 
     Returns:
         bool: True if directory exists or was created successfully, False otherwise
     """
-    try:
-        Path(directory_path).mkdir(parents=True, exist_ok=True)
+    if directory_path in _ready_directories:
         return True
+    try:
+        try:
+            os.mkdir(directory_path)
+        except FileExistsError:
+            if not os.path.isdir(directory_path):
+                raise
+        except FileNotFoundError:
+            os.makedirs(directory_path, exist_ok=True)
     except (OSError, PermissionError) as e:
-        print(f"Warning: Could not create log directory {directory_path}: {e}")
+        sys.stderr.write(
+            f"Warning: Could not create log directory {directory_path}: {e}\n"
+        )
         return False
+    _ready_directories.add(directory_path)
+    return True
+
+
+# Buffered log bytes are written out once they reach this size
+LOG_FLUSH_THRESHOLD = 64 * 1024
+# Longest time (seconds) a buffered log record waits before it reaches the file
+LOG_FLUSH_INTERVAL = 1.0
+# A log buffer that grew past this after a burst is reallocated rather than kept
+_LOG_BUFFER_RETAIN = 128 * 1024
+
+
+class BufferedRotatingHandler(logging.Handler):
+    """
+    Size-rotated log file handler that batches records into few writes.
+
+    Formatted records accumulate in a reusable buffer that is written out once it
+    reaches ``flush_threshold`` bytes, when a record at ``flush_level`` or above
+    arrives, every ``flush_interval`` seconds from a daemon thread, and on
+    ``flush()``/``close()`` (``logging.shutdown`` calls both at exit). Rotation
+    follows ``RotatingFileHandler``: ``path.1`` ... ``path.<backup_count>``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        flush_threshold: int = LOG_FLUSH_THRESHOLD,
+        flush_level: int = logging.WARNING,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ) -> None:
+        super().__init__()
+        self.baseFilename = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_threshold = flush_threshold
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._buf = bytearray()
+        self._size = 0
+        self._stream: Optional[io.BufferedWriter] = None
+        self._open()
+        self._stopped = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_periodically, name="log-flush", daemon=True
+            ).start()
+
+    def _open(self) -> None:
+        fd = os.open(
+            self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600
+        )
+        self._size = os.fstat(fd).st_size
+        self._stream = io.BufferedWriter(
+            io.FileIO(fd, "a", closefd=True), buffer_size=self.flush_threshold
+        )
+
+    def _rollover(self) -> None:
+        self._stream.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.baseFilename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.baseFilename}.{i + 1}")
+        os.replace(self.baseFilename, f"{self.baseFilename}.1")
+        self._open()
+
+    def _write_buffer(self) -> None:
+        """Write out the buffered records; the caller holds ``self.lock``."""
+        if not self._buf or self._stream is None:
+            return
+        if (
+            self.max_bytes > 0
+            and self.backup_count > 0
+            and self._size
+            and self._size + len(self._buf) > self.max_bytes
+        ):
+            self._rollover()
+        self._stream.write(self._buf)
+        self._stream.flush()
+        self._size += len(self._buf)
+        if len(self._buf) > _LOG_BUFFER_RETAIN:
+            self._buf = bytearray()
+        else:
+            self._buf.clear()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buf += self.format(record).encode("utf-8")
+            self._buf.append(0x0A)
+            if (
+                len(self._buf) >= self.flush_threshold
+                or record.levelno >= self.flush_level
+            ):
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write_buffer()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stopped.set()
+        with self.lock:
+            try:
+                self._write_buffer()
+            finally:
+                if self._stream is not None:
+                    self._stream.close()
+                    self._stream = None
+        super().close()
+
+
+# Settings, log path and root handlers installed by the last configure_logging call
+_logging_state: Optional[Tuple[tuple, Optional[str], list]] = None
+# Background thread that runs the file and console handlers
+_listener: Optional[QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """Drain queued records and close the handlers started by configure_logging."""
+    global _listener, _logging_state
+    listener, _listener = _listener, None
+    _logging_state = None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
 
 
 def configure_logging(
@@ -89,14 +346,13 @@ def configure_logging(
     applied. When ``SCRAPER_ENV`` is set to ``development`` the function verifies that
     the expected permissions are present and logs a warning otherwise.
 
+    The root logger only gets a ``QueueHandler``; the file and console handlers run
+    on a ``QueueListener`` thread so logging callers never block on I/O.
+
     Returns:
         str: Path to the log file, or None if file logging couldn't be set up.
     """
-    # Prevent duplicate handler setup
-    logger = logging.getLogger()
-    if logger.handlers:
-        # Clear existing handlers to avoid duplicates
-        logger.handlers.clear()
+    global _listener, _logging_state
 
     # Determine log level
     if log_level is None:
@@ -110,6 +366,18 @@ def configure_logging(
         if not log_dir:
             log_dir = get_default_log_directory()
 
+    # Repeat calls with the same settings keep the installed handlers instead of
+    # tearing them down and reopening the log file
+    settings = (log_dir, log_level, max_bytes, backup_count, log_filename)
+    root_logger = logging.getLogger()
+    if (
+        _logging_state is not None
+        and _logging_state[0] == settings
+        and root_logger.handlers == _logging_state[2]
+    ):
+        root_logger.setLevel(log_level)
+        return _logging_state[1]
+
     # Ensure log directory exists
     log_filepath = None
     handlers = []
@@ -118,12 +386,9 @@ def configure_logging(
         try:
             log_filepath = os.path.join(log_dir, log_filename)
 
-            # Create rotating file handler
-            file_handler = RotatingFileHandler(
-                log_filepath,
-                maxBytes=max_bytes,
-                backupCount=backup_count,
-                encoding="utf-8",  # Ensure UTF-8 encoding for international characters
+            # Create rotating file handler; records are written in UTF-8 batches
+            file_handler = BufferedRotatingHandler(
+                log_filepath, max_bytes=max_bytes, backup_count=backup_count
             )
 
             if os.name != "nt":
@@ -142,39 +407,46 @@ def configure_logging(
                 except OSError as e:
                     logging.debug("Could not verify log file permissions: %s", e)
 
-            file_handler.setLevel(log_level)
-
             # Format for file output (more detailed)
-            file_formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_FILE_FORMATTER)
             handlers.append(file_handler)
 
         except (OSError, PermissionError) as e:
-            print(f"Warning: Could not set up file logging: {e}")
-            print("Continuing with console logging only...")
+            sys.stderr.write(
+                f"Warning: Could not set up file logging: {e}\n"
+                "Continuing with console logging only...\n"
+            )
     else:
-        print("Warning: Could not create log directory. File logging disabled.")
+        sys.stderr.write(
+            "Warning: Could not create log directory. File logging disabled.\n"
+        )
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
 
     # Format for console output (simpler, more readable)
-    console_formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     handlers.append(console_handler)
 
-    # Configure root logger
+    # Stop the previous listener so its queue is drained and its file closed
+    shutdown_logging()
+
+    # Configure root logger. Handlers stay at NOTSET, so the root level alone
+    # decides what is logged and records below it are not even enqueued.
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    # prepare() stores the formatted text in record.msg; keep it to the bare
+    # message so the listener's handlers add the only prefix
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True,  # Force reconfiguration even if already configured
     )
+    _listener = QueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    _logging_state = (settings, log_filepath, list(root_logger.handlers))
 
     # Test the logging setup
     logger = logging.getLogger(__name__)
@@ -195,7 +467,7 @@ def configure_logging(
 
 def set_log_level(level: Union[int, str]) -> None:
     """
-    Change the logging level for all handlers.
+    Change the logging level; handlers are left at NOTSET and follow the root.
 
     Args:
         level (int or str): New logging level (e.g., logging.DEBUG, 'DEBUG', 'INFO', etc.)
@@ -203,13 +475,14 @@ def set_log_level(level: Union[int, str]) -> None:
     if isinstance(level, str):
         level = getattr(logging, level.upper(), logging.INFO)
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
+    logging.getLogger().setLevel(level)
+    logging.debug("Log level changed to: %s", logging.getLevelName(level))
 
-    for handler in root_logger.handlers:
-        handler.setLevel(level)
 
-    logging.info(f"Log level changed to: {logging.getLevelName(level)}")
+@functools.lru_cache(maxsize=128)
+def _cached_logger(name: str) -> logging.Logger:
+    """``logging.getLogger`` without taking the logging lock on repeat calls."""
+    return logging.getLogger(name)
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -223,13 +496,11 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         logging.Logger: Logger instance
     """
     if name is None:
-        # Get the caller's module name
-        import inspect
+        # Get the caller's module name; sys._getframe is CPython-specific but
+        # avoids importing inspect
+        name = sys._getframe(1).f_globals.get("__name__", "scraper")
 
-        frame = inspect.currentframe().f_back
-        name = frame.f_globals.get("__name__", "scraper")
-
-    return logging.getLogger(name)
+    return _cached_logger(name)
 
 
 # Utility function for quick setup with sensible defaults